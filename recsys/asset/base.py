@@ -19,6 +19,7 @@
 """Persistence Base Class"""
 from __future__ import annotations
 from abc import ABC, abstractmethod
+import logging
 
 
 # ------------------------------------------------------------------------------------------------ #
@@ -30,9 +31,30 @@ class Asset(ABC):
         desc (str): desc of the asset
     """
 
+    __slots__ = ("_filepath",)
+
+    def __init_subclass__(cls, **kwargs) -> None:
+        """Creates one logger per class rather than one per instance."""
+        super().__init_subclass__(**kwargs)
+        cls._logger = logging.getLogger(f"{cls.__module__}.{cls.__name__}")
+
     def __init__(self) -> None:
         self._filepath = None
 
+    def __setstate__(self, state: dict | tuple) -> None:
+        """Restores pickled state, including dict state pickled before assets declared slots.
+
+        Legacy state arrives as a plain dict. Keys without a slot, such as the per-instance
+        logger, are dropped.
+        """
+        if isinstance(state, tuple):
+            instance_state, slot_state = state
+            state = {**(instance_state or {}), **(slot_state or {})}
+        slots = {slot for cls in type(self).__mro__ for slot in getattr(cls, "__slots__", ())}
+        for attr, value in state.items():
+            if attr in slots:
+                object.__setattr__(self, attr, value)
+
     @property
     @abstractmethod
     def name(self) -> str:
@@ -69,6 +91,11 @@ class AssetCentreABC(ABC):
 
     """
 
+    def __init_subclass__(cls, **kwargs) -> None:
+        """Creates one logger per class rather than one per instance."""
+        super().__init_subclass__(**kwargs)
+        cls._logger = logging.getLogger(f"{cls.__module__}.{cls.__name__}")
+
     @abstractmethod
     def add(self, asset: Asset) -> None:
         """Adds an asset to the repository
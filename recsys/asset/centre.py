@@ -19,9 +19,8 @@
 """Datasource Centre Module"""
 import os
 import shutil
-import logging
 
-from sqlalchemy import text, exc
+from sqlalchemy import bindparam, text, exc
 import pandas as pd
 
 from recsys.services.io import IOService
@@ -40,6 +39,8 @@ class AssetCentre(AssetCentreABC):
         io (type[IOService]): Read write capability for files.
     """
 
+    __COLUMNS = ("name", "type", "description", "filepath")
+
     def __init__(
         self,
         database: Database,
@@ -49,13 +50,13 @@ class AssetCentre(AssetCentreABC):
     ) -> None:
         super().__init__()
         self._engine = database.engine
-        self._cxn = database.engine.connect()
+        self._cxn = self._engine.connect()
         self._io = io
         self._directory = directory
         self._tablename = tablename
-        self._logger = logging.getLogger(
-            f"{self.__module__}.{self.__class__.__name__}",
-        )
+        # Registry lookups keyed by (name, type). Values are the filepath, or False if the asset
+        # is not registered. Entries are dropped whenever this centre changes the registry.
+        self._lookups = {}
 
     def add(self, asset: Asset) -> Asset:
         """Adds an asset to the repository and returns it.
@@ -75,8 +76,34 @@ class AssetCentre(AssetCentreABC):
 
         self._check_in(asset)
         self._save(asset)
+        self._evict(asset.name, asset.__class__.__name__)
         return asset
 
+    def add_many(self, assets: list) -> list:
+        """Adds several assets to the repository in a single registry write and returns them.
+
+        Args:
+            assets (list): The asset instances.
+        Raises: FileExistsError if any asset already exists. None of the assets are added.
+        """
+        assets = [self._set_filepath(asset) for asset in assets]
+        try:
+            # One registry query covers the existence check for the whole batch.
+            registered = self._get_registered(names=[asset.name for asset in assets])
+            for asset in assets:
+                if (asset.name, asset.__class__.__name__) in registered:
+                    msg = f"An asset of type {asset.__class__.__name__} named {asset.name} already exists. Change the name or replace the asset."
+                    self._logger.error(msg)
+                    raise FileExistsError(msg)
+        except exc.OperationalError:  # If first add, database won't exist at time of existence check.
+            pass
+
+        self._check_in(*assets)
+        for asset in assets:
+            self._save(asset)
+            self._evict(asset.name, asset.__class__.__name__)
+        return assets
+
     def get(self, name: str, asset_type: str) -> Asset:
         """Gets the asset with the designated name.
 
@@ -87,11 +114,12 @@ class AssetCentre(AssetCentreABC):
         """
         filepath = self._get_filepath(name=name, asset_type=asset_type)
         try:
-            return self._load(filepath=filepath)
+            asset = self._load(filepath=filepath)
         except AttributeError:
             msg = f"Attribute named {name} of type{asset_type} does not exist."
             self._logger.error(msg)
             raise FileNotFoundError(msg)
+        return asset
 
     def remove(self, name: str, asset_type: str) -> None:
         """Removes the asset with the designated name from storage and registry.
@@ -104,6 +132,7 @@ class AssetCentre(AssetCentreABC):
         filepath = self._get_filepath(name=name, asset_type=asset_type)
         self._check_out(name=name, asset_type=asset_type)
         self._delete(filepath=filepath)
+        self._evict(name, asset_type)
 
     def replace(self, asset: Asset) -> None:
         """Replaces an asset in registry and storage.
@@ -120,8 +149,9 @@ class AssetCentre(AssetCentreABC):
             raise FileNotFoundError(msg)
 
         self._check_out(name=asset.name, asset_type=asset.__class__.__name__)
-        self._check_in(asset=asset)
+        self._check_in(asset)
         self._save(asset)
+        self._evict(asset.name, asset.__class__.__name__)
 
     def exists(self, name: str, asset_type: str) -> bool:
         """Determines if an asset of the designated name and type exists.
@@ -130,18 +160,17 @@ class AssetCentre(AssetCentreABC):
             name (str): Name of the asset.
             asset_type (str): The type of asset, i.e. class name.
         """
-        query = text(
-            f"SELECT EXISTS(SELECT 1 FROM {self._tablename} WHERE name='{name}' AND type='{asset_type}');"
-        )
-        exists = pd.read_sql(query, con=self._cxn).values[0][0]
+        exists = self._get_filepath(name=name, asset_type=asset_type) is not False
         self._logger.debug(exists)
-        return exists == 1
+        return exists
 
     def show(self) -> None:
         """Prints the registry to screen."""
-        df = self._get_registry()
-        df = df.drop(["index"], axis=1, errors="ignore")  # Kluge to dump extra index column.
-        print(df)
+        print(self._get_registry())
+
+    def clear_cache(self) -> None:
+        """Empties the cache of registry lookups."""
+        self._lookups.clear()
 
     def reset(self, confirm: bool = True) -> None:
         """Resets the asset registry and PURGES the asset repository."""
@@ -152,13 +181,15 @@ class AssetCentre(AssetCentreABC):
             if "y" in confirmation.lower():
                 self._reset_registry()
                 self._purge_assets()
+                self.clear_cache()
         else:  # pragma: no cover
             self._reset_registry()
             self._purge_assets()
+            self.clear_cache()
 
-    def _check_in(self, asset: Asset) -> None:
-        """Adds an asset to the registry."""
-        df = self._get_entry(asset)
+    def _check_in(self, *assets: Asset) -> None:
+        """Adds one or more assets to the registry in a single insert."""
+        df = self._get_entries(*assets)
         try:
             df.to_sql(
                 name=self._tablename,
@@ -167,10 +198,25 @@ class AssetCentre(AssetCentreABC):
                 index=False,
             )
         except Exception:  # pragma: no cover
-            msg = f"Exception when attempting to add asset {asset.name} to the registry in the {self._tablename} table."
+            names = ", ".join(asset.name for asset in assets)
+            msg = f"Exception when attempting to add asset(s) {names} to the registry in the {self._tablename} table."
             self._logger.error(msg)
             raise
 
+    def _get_registered(self, names: list) -> set:
+        """Returns the (name, type) pairs registered under any of the names.
+
+        Args:
+            names (list): Names of the assets.
+        """
+        query = text(f"SELECT name, type FROM {self._tablename} WHERE name IN :names;")
+        query = query.bindparams(bindparam("names", expanding=True))
+        return {tuple(row) for row in self._cxn.execute(query, {"names": names})}
+
+    def _evict(self, name: str, asset_type: str) -> None:
+        """Drops the cached registry lookup for an asset."""
+        self._lookups.pop((name, asset_type), None)
+
     def _check_out(self, name: str, asset_type: str) -> None:
         """Removes an asset from the registry by name.
 
@@ -178,38 +224,37 @@ class AssetCentre(AssetCentreABC):
             name (str): Name of the asset.
             asset_type (str): The type of asset, i.e. class name.
         """
-        query = text(f"DELETE FROM {self._tablename} WHERE name='{name}' AND type='{asset_type}';")
-        self._cxn.execute(query)
+        query = text(f"DELETE FROM {self._tablename} WHERE name=:name AND type=:type;")
+        self._cxn.execute(query, {"name": name, "type": asset_type})
 
-    def _get_entry(self, asset: Asset) -> pd.DataFrame:
-        """Extracts information from Asset and formats registration entry
+    def _get_entries(self, *assets: Asset) -> pd.DataFrame:
+        """Extracts information from Assets and formats one registration entry per asset
 
         Args:
-            asset (Asset): The asset to be persisted.
+            assets (Asset): The assets to be persisted.
         """
-        d = {
-            "name": asset.name,
-            "type": asset.__class__.__name__,
-            "description": asset.desc,
-            "filepath": asset.filepath,
-        }
-        df = pd.DataFrame(data=d, index=[0])
-        return df
+        rows = [(a.name, a.__class__.__name__, a.desc, a.filepath) for a in assets]
+        return pd.DataFrame.from_records(rows, columns=list(AssetCentre.__COLUMNS))
 
     def _get_filepath(self, name: str, asset_type: str) -> str:
         """Obtains the filepath for the name and asset type from the registry.
 
+        Returns False if the asset is not registered. Results are cached until the asset is
+        added, replaced, or removed.
+
         Args:
            name (str): Name of the asset.
            asset_type (str): The type or class name of the asset.
         """
-        query = text(
-            f"SELECT filepath FROM {self._tablename} WHERE name='{name}' AND type='{asset_type}';"
-        )
-        try:
-            return pd.read_sql(query, con=self._cxn).values[0][0]
-        except IndexError:
-            return False
+        key = (name, asset_type)
+        if key not in self._lookups:
+            query = text(
+                f"SELECT filepath FROM {self._tablename} WHERE name=:name AND type=:type;"
+            )
+            # Scalars are fetched directly from the cursor rather than through a DataFrame.
+            filepath = self._cxn.execute(query, {"name": name, "type": asset_type}).scalar()
+            self._lookups[key] = False if filepath is None else filepath
+        return self._lookups[key]
 
     def _set_filepath(self, asset: Asset) -> Asset:
         """Constructs a filepath and sets the filepath attribute on the asset
@@ -226,8 +271,11 @@ class AssetCentre(AssetCentreABC):
     def _get_registry(self) -> pd.DataFrame:
         """Returns the registry dataframe."""
         try:
-            query = text(f"SELECT * from {self._tablename};")
-            return pd.read_sql(query, con=self._cxn)
+            # Explicit columns keep any stray index column written by earlier versions out.
+            columns = ", ".join(AssetCentre.__COLUMNS)
+            query = text(f"SELECT {columns} FROM {self._tablename};")
+            rows = self._cxn.execute(query).fetchall()
+            return pd.DataFrame.from_records(rows, columns=AssetCentre.__COLUMNS)
 
         except Exception:  # pragma: no cover
             msg = (
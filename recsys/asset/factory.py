@@ -26,6 +26,10 @@ from recsys.asset.base import Asset
 
 class AssetFactory:
 
+    __slots__ = ()
+
+    _logger = logging.getLogger(f"{__module__}.{__qualname__}")
+
     __asset_types = {
         "movielens1m": MovieLens1M,
         "movielens10m": MovieLens10M,
@@ -44,9 +48,6 @@ class AssetFactory:
             kwargs (dict): Other parameters which were only available at runtime.
 
         """
-        cls._logger = logging.getLogger(
-            f"{cls.__module__}.{cls.__class__.__name__}",
-        )
         try:
             asset = AssetFactory.__asset_types[asset_schema["asset_type"].lower()]
         except KeyError:
@@ -62,5 +63,4 @@ class AssetFactory:
 
         # Add dictionary containing additional parameters which become available
         # at runtime, to the params dictionary.
-        params = params.update(kwargs)
-        return asset(**params)
+        return asset(**{**params, **kwargs})
@@ -22,7 +22,7 @@ import mlflow
 
 
 # ------------------------------------------------------------------------------------------------ #
-@dataclass
+@dataclass(slots=True)
 class Artifact:
     isfile: bool  # Indicates whether the artifact is a file or a directory
     path: str  # The filepath or directory containing the artifacts
@@ -32,4 +32,4 @@ class Artifact:
         if self.isfile:
             mlflow.log_artifact(local_path=self.path, artifact_path=self.uripath)
         else:
-            mlflow.log_artifacts(local_path=self.path, artifact_path=self.uripath)
+            mlflow.log_artifacts(local_dir=self.path, artifact_path=self.uripath)
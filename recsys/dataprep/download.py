@@ -20,7 +20,6 @@
 import os
 import requests
 from tqdm import tqdm
-import logging
 
 from recsys import Operator
 
@@ -34,7 +33,7 @@ class DownloadOperator(Operator):
     Args:
         source (str): The URL to the zip file resource
         destination (str): A filename into which the zip file will be downloaded.
-        chunk_size (int): Size of download chunks
+        chunk_size (int): Size of download chunks in bytes. Default = 1 MiB
         force (bool): Whether to force execution.
     """
 
@@ -42,16 +41,13 @@ class DownloadOperator(Operator):
     __desc = "Downloads files from remote sites using HTTP requests."
 
     def __init__(
-        self, source: str, destination: str, chunk_size: int = 1024, force: bool = False
+        self, source: str, destination: str, chunk_size: int = 1024 * 1024, force: bool = False
     ) -> None:
         super().__init__()
         self._source = source
         self._destination = destination
         self._force = force
         self._chunk_size = chunk_size
-        self._logger = logging.getLogger(
-            f"{self.__module__}.{self.__class__.__name__}",
-        )
 
     def __call__(self, *args, **kwargs) -> None:
         """Downloads a zipfile."""
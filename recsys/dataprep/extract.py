@@ -18,8 +18,8 @@
 # ================================================================================================ #
 """Data Compression Module"""
 import os
+import shutil
 from zipfile import ZipFile
-import logging
 
 from recsys import Operator
 
@@ -39,6 +39,8 @@ class ZipExtractOperator(Operator):
 
     __name = "zip_extract_operator"
     __desc = "Extracts files from zip archives."
+    # Members are copied in 1 MiB chunks, rather than the 8 KiB default of ZipFile.extract.
+    __CHUNK_SIZE = 1024 * 1024
 
     def __init__(
         self, source: str, destination: str, member: str = None, force: bool = False
@@ -48,9 +50,6 @@ class ZipExtractOperator(Operator):
         self._destination = destination
         self._force = force
         self._member = member
-        self._logger = logging.getLogger(
-            f"{self.__module__}.{self.__class__.__name__}",
-        )
 
     def __call__(self, *args, **kwargs) -> None:
         """Extracts the contents"""
@@ -61,14 +60,14 @@ class ZipExtractOperator(Operator):
 
             with ZipFile(self._source, mode="r") as zip:
                 for zip_info in zip.infolist():
-                    if zip_info.filename[-1] == "/":
+                    if zip_info.is_dir():
                         continue
-                    zip_info.filename = os.path.basename(zip_info.filename)
-                    if self._member is not None:
-                        if zip_info.filename == self._member:
-                            zip.extract(zip_info, self._destination)
-                        else:
-                            continue
-                    else:
-                        zip.extract(zip_info, self._destination)
+                    filename = os.path.basename(zip_info.filename)
+                    if self._member is not None and filename != self._member:
+                        continue
+                    filepath = os.path.join(self._destination, filename)
+                    with zip.open(zip_info) as source, open(filepath, "wb") as destination:
+                        shutil.copyfileobj(
+                            source, destination, length=ZipExtractOperator.__CHUNK_SIZE
+                        )
             self._logger.debug(f"Extracted zip archive from {self._source} to {self._destination}")
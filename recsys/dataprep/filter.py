@@ -18,15 +18,83 @@
 # ================================================================================================ #
 """Data Prep: Filter Module"""
 from typing import Union
-import logging
-from tqdm import tqdm
 from pandas import pd
+import numpy as np
 
 from recsys import Dataset
 
 from recsys import Operator
 
 
+# ------------------------------------------------------------------------------------------------ #
+def _count_interactions(
+    data: pd.DataFrame, by: str, pair: list, drop_duplicates: bool
+) -> tuple[np.ndarray, np.ndarray]:
+    """Returns each row's code for the 'by' column and the number of interactions per code.
+
+    The ids are factorized once and counted with a histogram of the codes, so the rows to
+    keep are selected by indexing the counts rather than sorting them and testing membership.
+
+    Args:
+        data (pd.DataFrame): The user rating interaction dataframe.
+        by (str): The id column to count by.
+        pair (list): The user and item id columns identifying an interaction.
+        drop_duplicates (bool): Whether repeated interactions are counted once.
+    """
+    codes, uniques = pd.factorize(data[by])
+    counted = codes[~data.duplicated(pair).to_numpy()] if drop_duplicates else codes
+    return codes, np.bincount(counted, minlength=uniques.size)
+
+
+# ------------------------------------------------------------------------------------------------ #
+def _cap_interactions(
+    data: pd.DataFrame, by: str, timestamp: str, cap: int, random_state: int = None
+) -> tuple[np.ndarray, int]:
+    """Returns a mask of the interactions retained when each group is capped, and the number cut.
+
+    In time order, the first 'cap' interactions of each group are retained and each later
+    interaction replaces a retained interaction chosen at random. Each replacement draws one
+    of the group's 'cap' slots, so the final occupant of a slot is the latest interaction that
+    drew it, or the original if none did. The replacements for every group are therefore
+    resolved at once from the draws, rather than row by row.
+
+    Args:
+        data (pd.DataFrame): The user rating interaction dataframe.
+        by (str): The id column to group by.
+        timestamp (str): The timestamp column.
+        cap (int): The maximum number of interactions per group.
+        random_state (int): Seed for the random replacements.
+    Raises: ValueError if cap is not a positive integer.
+    """
+    if cap <= 0:
+        raise ValueError(f"The cap must be a positive integer, not {cap}.")
+    codes = pd.factorize(data[by])[0].astype(np.int64)
+    # Rows ordered by group, then time. Ranks are the positions within each group.
+    order = np.lexsort((data[timestamp].to_numpy(), codes))
+    codes = codes[order]
+    first = np.ones(codes.size, dtype=bool)
+    first[1:] = codes[1:] != codes[:-1]
+    starts = np.flatnonzero(first)
+    ranks = np.arange(codes.size) - np.repeat(starts, np.diff(starts, append=codes.size))
+
+    pending = ranks >= cap
+    slots = codes * cap
+    rng = np.random.default_rng(random_state)
+    drawn = slots[pending] + rng.integers(0, cap, size=int(pending.sum()))
+    # A stable sort keeps each slot's draws in time order, so the last draw is the occupant.
+    by_slot = np.argsort(drawn, kind="stable")
+    drawn = drawn[by_slot]
+    last = np.ones(drawn.size, dtype=bool)
+    last[:-1] = drawn[1:] != drawn[:-1]
+
+    keep = np.zeros(codes.size, dtype=bool)
+    keep[np.flatnonzero(pending)[by_slot[last]]] = True
+    keep[~pending] = ~np.isin(slots[~pending] + ranks[~pending], drawn)
+    mask = np.empty(codes.size, dtype=bool)
+    mask[order] = keep
+    return mask, int(pending.sum())
+
+
 # ------------------------------------------------------------------------------------------------ #
 #                            MINIMUM ITEMS PER USER                                                #
 # ------------------------------------------------------------------------------------------------ #
@@ -57,9 +125,6 @@ class MinItemsPerUserFilter(Operator):
         self._drop_duplicates = drop_duplicates
         self._userid = userid
         self._itemid = itemid
-        self._logger = logging.getLogger(
-            f"{self.__module__}.{self.__class__.__name__}",
-        )
 
     def __call__(self, data: Union[pd.DataFrame, Dataset]) -> pd.DataFrame:
         """Filters the user interactions by the number of items per user
@@ -67,15 +132,13 @@ class MinItemsPerUserFilter(Operator):
         Args:
             data (pd.DataFrame) The user rating interaction dataframe.
         """
-        userids = (
-            data.drop_duplicates([self._userid, self._itemid])[self._userid]
-            if self._drop_duplicates
-            else data[self._userid]
+        codes, items_per_user = _count_interactions(
+            data=data,
+            by=self._userid,
+            pair=[self._userid, self._itemid],
+            drop_duplicates=self._drop_duplicates,
         )
-        items_per_user = userids.value_counts()
-        users_to_keep = list(items_per_user[items_per_user >= self._min_items_per_user])
-
-        return data[data[self._userid].isin(users_to_keep)].copy()
+        return data[(items_per_user >= self._min_items_per_user)[codes]].copy()
 
 
 # ------------------------------------------------------------------------------------------------ #
@@ -108,9 +171,6 @@ class MinUsersPerItemFilter(Operator):
         self._drop_duplicates = drop_duplicates
         self._userid = userid
         self._itemid = itemid
-        self._logger = logging.getLogger(
-            f"{self.__module__}.{self.__class__.__name__}",
-        )
 
     def __call__(self, data: Union[pd.DataFrame, Dataset]) -> pd.DataFrame:
         """Filters the items with interactions below a threshold
@@ -118,15 +178,13 @@ class MinUsersPerItemFilter(Operator):
         Args:
             data (pd.DataFrame) The user rating interaction dataframe.
         """
-        itemids = (
-            data.drop_duplicates([self._userid, self._itemid])[self._itemid]
-            if self._drop_duplicates
-            else data[self._itemid]
+        codes, users_per_item = _count_interactions(
+            data=data,
+            by=self._itemid,
+            pair=[self._userid, self._itemid],
+            drop_duplicates=self._drop_duplicates,
         )
-        users_per_item = itemids.value_counts()
-        items_to_keep = list(users_per_item[users_per_item >= self._min_users_per_item])
-
-        return data[data[self._userid].isin(items_to_keep)].copy()
+        return data[(users_per_item >= self._min_users_per_item)[codes]].copy()
 
 
 # ------------------------------------------------------------------------------------------------ #
@@ -147,6 +205,7 @@ class MaxItemsPerUserFilter(Operator):
         userid (str): Name of the column containing the user id.
         itemid (str): Name of the column containing the item id.
         timestamp (timestamp): Timestamp of the interaction
+        random_state (int): Seed for the random replacements. Default = None
 
     Reference:
     .. [1] S. Schelter, U. Celebi, and T. Dunning, “Efficient Incremental Cooccurrence
@@ -165,17 +224,20 @@ class MaxItemsPerUserFilter(Operator):
         userid: str = "userId",
         itemid: str = "movieId",
         timestamp: str = "timestamp",
+        random_state: int = None,
     ) -> None:
         super().__init__()
+        if max_items_per_user <= 0:
+            msg = f"max_items_per_user must be a positive integer, not {max_items_per_user}."
+            self._logger.error(msg)
+            raise ValueError(msg)
         self._max_items_per_user = max_items_per_user
         self._drop_duplicates = drop_duplicates
         self._userid = userid
         self._itemid = itemid
         self._timestamp = timestamp
+        self._random_state = random_state
         self._interactions_cut = 0
-        self._logger = logging.getLogger(
-            f"{self.__module__}.{self.__class__.__name__}",
-        )
 
     def __call__(self, data: Union[pd.DataFrame, Dataset]) -> pd.DataFrame:
         """Filters the user interactions above a threshold
@@ -184,49 +246,15 @@ class MaxItemsPerUserFilter(Operator):
             data (pd.DataFrame) The user rating interaction dataframe.
         """
 
-        # Sample the first user interactions, up to the threshold
-        data = self._sample_interactions(data=data)
-
-        data.drop(columns=["interactions"], inplace=True)
-
-        self._logger.debug(f"\nInteractions cut: {self._interactions_cut}")
-
-        return data
-
-    def _sample_interactions(self, data: pd.DataFrame) -> pd.DataFrame:
-        """Obtain the first transactions up to the threshold."""
-
-        # Groupby user, sort by timestamp ascending within groups, and count the interactions.
-        data["interactions"] = (
-            data.sort_values(by=self._timestamp, ascending=True)
-            .groupby(by=self._userid, group_keys=False)
-            .cumcount()
-            + 1
+        keep, self._interactions_cut = _cap_interactions(
+            data=data,
+            by=self._userid,
+            timestamp=self._timestamp,
+            cap=self._max_items_per_user,
+            random_state=self._random_state,
         )
-
-        # Retain the first interactions up to the  threshold
-        data = data[data["interactions"] <= self._max_items_per_user]
-        pending = data[data["interactions"] > self._max_items_per_user]
-
-        if pending.shape[0] > 0:
-            data = self._handle_pending(data=data, pending=pending)
-        return data
-
-    def _handle_pending(self, data: pd.DataFrame, pending: pd.DataFrame) -> pd.DataFrame:
-        """Existing interactions are randomly withdrawn to accommodate new interactions."""
-
-        # Repeatedly remove a single interaction at random and replace with new interaction.
-        groups = pending.sort_values(by=[self._timestamp], ascending=True).groupby(
-            by=self._userid, group_keys=False
-        )
-        for name, ratings in tqdm(groups):
-            for _, row in ratings.iterrows():
-                row = row.to_frame()
-                eviction = data[data[self._userid] == name].sample(n=1, replace=False, axis=0)
-                self._interactions_cut += 1
-                data = data.drop(eviction.index.values)
-                data = pd.concat([data, row.T], axis=0)
-        return data
+        self._logger.debug(f"\nInteractions cut: {self._interactions_cut}")
+        return data[keep].copy()
 
 
 # ------------------------------------------------------------------------------------------------ #
@@ -247,6 +275,7 @@ class MaxUsersPerItemFilter(Operator):
         userid (str): Name of the column containing the user id.
         itemid (str): Name of the column containing the item id.
         timestamp (timestamp): Timestamp of the interaction
+        random_state (int): Seed for the random replacements. Default = None
 
     Reference:
     .. [1] S. Schelter, U. Celebi, and T. Dunning, “Efficient Incremental Cooccurrence
@@ -266,17 +295,20 @@ class MaxUsersPerItemFilter(Operator):
         userid: str = "userId",
         itemid: str = "movieId",
         timestamp: str = "timestamp",
+        random_state: int = None,
     ) -> None:
         super().__init__()
+        if max_users_per_item <= 0:
+            msg = f"max_users_per_item must be a positive integer, not {max_users_per_item}."
+            self._logger.error(msg)
+            raise ValueError(msg)
         self._max_users_per_item = max_users_per_item
         self._drop_duplicates = drop_duplicates
         self._userid = userid
         self._itemid = itemid
         self._timestamp = timestamp
+        self._random_state = random_state
         self._interactions_cut = 0
-        self._logger = logging.getLogger(
-            f"{self.__module__}.{self.__class__.__name__}",
-        )
 
     def __call__(self, data: Union[pd.DataFrame, Dataset]) -> pd.DataFrame:
         """Filters the items with interactions above a threshold
@@ -285,46 +317,12 @@ class MaxUsersPerItemFilter(Operator):
             data (pd.DataFrame) The user rating interaction dataframe.
         """
 
-        # Sample the first user interactions, up to the threshold
-        data = self._sample_interactions(data=data)
-
-        data.drop(columns=["interactions"], inplace=True)
-
-        self._logger.debug(f"\nInteractions cut: {self._interactions_cut}")
-
-        return data
-
-    def _sample_interactions(self, data: pd.DataFrame) -> pd.DataFrame:
-        """Obtain the first transactions up to the respective threshold."""
-
-        # Groupby user, sort by timestamp ascending within groups, and count the interactions.
-        data["interactions"] = (
-            data.sort_values(by=self._timestamp, ascending=True)
-            .groupby(by=self._itemid, group_keys=False)
-            .cumcount()
-            + 1
+        keep, self._interactions_cut = _cap_interactions(
+            data=data,
+            by=self._itemid,
+            timestamp=self._timestamp,
+            cap=self._max_users_per_item,
+            random_state=self._random_state,
         )
-
-        # Retain the first interactions up to the  threshold
-        data = data[data["interactions"] <= self._max_users_per_item]
-        pending = data[data["interactions"] > self._max_users_per_item]
-
-        if pending.shape[0] > 0:
-            data = self._handle_pending(data=data, pending=pending)
-        return data
-
-    def _handle_pending(self, data: pd.DataFrame, pending: pd.DataFrame) -> pd.DataFrame:
-        """Existing interactions are randomly withdrawn to accommodate new interactions."""
-
-        # Repeatedly remove a single interaction at random and replace with new interaction.
-        groups = pending.sort_values(by=[self._timestamp], ascending=True).groupby(
-            by=self._itemid, group_keys=False
-        )
-        for name, ratings in tqdm(groups):
-            for _, row in ratings.iterrows():
-                row = row.to_frame()
-                eviction = data[data[self._itemid] == name].sample(n=1, replace=False, axis=0)
-                self._interactions_cut += 1
-                data = data.drop(eviction.index.values)
-                data = pd.concat([data, row.T], axis=0)
-        return data
+        self._logger.debug(f"\nInteractions cut: {self._interactions_cut}")
+        return data[keep].copy()
@@ -18,7 +18,6 @@
 # ================================================================================================ #
 """Data Prep: Index Module"""
 from typing import Union
-import logging
 
 from pandas import pd
 import numpy as np
@@ -57,28 +56,25 @@ class IndexSequenceOperator(Operator):
         self._userid = userid
         self._itemid = itemid
 
-        self._logger = logging.getLogger(
-            f"{self.__module__}.{self.__class__.__name__}",
-        )
-
     def __call__(self, data: Union[pd.DataFrame, Dataset]) -> pd.DataFrame:
         """Filters the user interactions by the number of items per user
 
         Args:
             data (pd.DataFrame) The user rating interaction dataframe.
         """
-        if "itemidx" in data.columns:
+        if self._itemidx in data.columns:
             msg = "The dataset has already been reindexed."
             self._logger.info(msg)
-        else:
-            data = self._reindex(data=data, id=self._userid, to=self._useridx)
-            return self._reindex(data=data, id=self._itemid, to=self._itemidx)
+            return data
+        data = self._reindex(data=data, id=self._userid, to=self._useridx)
+        return self._reindex(data=data, id=self._itemid, to=self._itemidx)
 
     def _reindex(self, data: pd.DataFrame, id: str, to: str) -> pd.DataFrame:
-        """Creates sequential ids for users and movies."""
-        # Get unique user or movie ids.
-        features = np.sort(data[id].unique())
-        features = pd.DataFrame(data=features, columns=[id])
-        features.reset_index(inplace=True)
-        features = features.rename(columns={"index": to})
-        return data.merge(features, how="left", on=id)
+        """Creates sequential ids for users and movies.
+
+        Sorted factorization numbers the ids in ascending order in a single pass, giving the
+        same indices as ranking the sorted unique ids, without merging a lookup table back.
+        """
+        codes, _ = pd.factorize(data[id], sort=True)
+        # The indices are dense, so they fit in int32, halving the width of the column.
+        return data.assign(**{to: codes.astype(np.int32)})
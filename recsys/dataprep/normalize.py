@@ -18,12 +18,13 @@
 # ================================================================================================ #
 """Data Prep: Normalize Module"""
 from typing import Union
-import logging
 
-from pandas import pd
+import pandas as pd
+import numpy as np
 
-from recsys import Dataset
-from recsys import Operator
+from recsys.dataset.base import Dataset
+from recsys.dataprep.base import Operator
+from recsys.services.kernels import group_center
 
 
 # ------------------------------------------------------------------------------------------------ #
@@ -34,6 +35,9 @@ class NormalizeOperator(Operator):
 
     Args:
         by (str): The column containing the grouping variable.
+        rating_col (str): The column containing the ratings. Default = 'rating'
+        centered_col (str): The column to contain the centered ratings.
+            Default = 'rating_centered'
         epsilon (float): A factor added to the mean centered ratings to avoid zero values.
             Default = 1e-9
 
@@ -46,15 +50,14 @@ class NormalizeOperator(Operator):
         self,
         by: str,
         rating_col: str = "rating",
+        centered_col: str = "rating_centered",
         epsilon: float = 1e-9,
     ) -> None:
         super().__init__()
         self._by = by
         self._rating_col = rating_col
+        self._centered_col = centered_col
         self._epsilon = epsilon
-        self._logger = logging.getLogger(
-            f"{self.__module__}.{self.__class__.__name__}",
-        )
 
     def __call__(self, data: Union[pd.DataFrame, Dataset]) -> pd.DataFrame:
         """Mean centers ratings.
@@ -63,18 +66,16 @@ class NormalizeOperator(Operator):
             data (pd.DataFrame) The user rating interaction dataframe.
         """
         try:
-            # Obtain average ratings
-            rbar = data.groupby(by=self._by)[self._rating_col].mean().reset_index()
-            rbar.columns = [self._by, "rbar"]
-
-            # Merge with ratings dataset
-            data = data.merge(rbar, on=self._by, how="left")
-
-            # Compute centered rating and drop the average rating column
-            data[self._by] = data[self._rating_col] - data["rbar"]
-            data = data.drop(columns=["rbar"])
-            return data
-        except KeyError:
-            msg = f"Column {self._by} is not valid."
+            codes, groups = pd.factorize(data[self._by])
+            ratings = data[self._rating_col].to_numpy(dtype=np.float64)
+        except KeyError as e:
+            msg = f"Column {e.args[0]} is not valid."
             self._logger.error(msg)
             raise ValueError(msg)
+
+        # The group means and centered ratings come from one compiled pass over dense
+        # codes, rather than a groupby, a merge and a temporary column. Ratings are on a
+        # half star scale, so the centered ratings are stored in float32.
+        centered = group_center(codes, ratings, groups.size) + self._epsilon
+        centered = centered.astype(np.float32, copy=False)
+        return data.assign(**{self._centered_col: centered})
@@ -19,7 +19,6 @@
 """Train/Test Split Module"""
 from __future__ import annotations
 import os
-import logging
 
 from recsys import Operator
 from recsys.dataprep.artifact import Artifact
@@ -65,9 +64,6 @@ class TemporalSplitOperator(Operator):
         self._artifact = Artifact(isfile=False, path=directory, uripath="data")
         self._force = force
         self._validate()
-        self._logger = logging.getLogger(
-            f"{self.__module__}.{self.__class__.__name__}",
-        )
 
     @log
     def __call__(self, dataset: Dataset) -> None:
@@ -80,12 +76,19 @@ class TemporalSplitOperator(Operator):
             data = dataset.to_df()
 
             try:
-                data_sorted = data.sort_values(by=[self._timestamp_var], ascending=True)
+                timestamps = data[self._timestamp_var]
             except KeyError:
                 msg = "The timestamp variable is invalid."
                 self._logger.error(msg)
                 raise ValueError(msg)
 
+            # Ratings are often persisted in time order, in which case the split is a slice
+            # with no sort. A stable sort keeps ties in frame order either way.
+            if timestamps.is_monotonic_increasing:
+                data_sorted = data
+            else:
+                data_sorted = data.sort_values(by=[self._timestamp_var], kind="stable")
+
             total_examples = data.shape[0]
 
             train_size = int(self._train_size * data.shape[0])
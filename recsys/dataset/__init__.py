@@ -16,3 +16,5 @@
 # License    : MIT License                                                                         #
 # Copyright  : (c) 2023 John James                                                                 #
 # ================================================================================================ #
+# Importing the concrete datasets registers them with the DatasetFactoryOperator.
+from recsys.dataset import movielens  # noqa: F401
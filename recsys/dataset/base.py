@@ -30,6 +30,8 @@ from recsys.asset.base import Asset
 class Dataset(Asset):
     """Asset base class for dataset objects"""
 
+    __slots__ = ()
+
     def __init__(self) -> None:
         super().__init__()
 
@@ -62,12 +64,24 @@ class Dataset(Asset):
     def size(self) -> int:
         """The number of elements in the Dataset"""
 
+    @abstractmethod
+    def column(self, name: str) -> np.ndarray:
+        """Returns the designated column as a numpy array."""
+
     @abstractmethod
     def to_df(self) -> pd.DataFrame:
         """Returns a DataFrame representation of the Dataset object."""
 
-    def summary(self) -> None:
+    def summary(self, verbose: bool = False) -> pd.DataFrame:
+        """Returns summary statistics, which are computed once and cached.
+
+        Args:
+            verbose (bool): Whether to print the summary. Default is False
+        """
         self._summarize()
+        if verbose:
+            print(self._summary)
+        return self._summary
 
     @abstractmethod
     def _summarize(self) -> None:
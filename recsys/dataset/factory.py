@@ -17,11 +17,10 @@
 # Copyright  : (c) 2023 John James                                                                 #
 # ================================================================================================ #
 """Dataset Factory Module"""
-import logging
+from typing import Callable
 
 import pandas as pd
 
-from recsys.dataset.movielens import MovieLens
 from recsys.workflow.operator import Operator
 from recsys.dataset.base import Dataset
 
@@ -39,22 +38,33 @@ class DatasetFactoryOperator(Operator):
     __name = "dataset_factory_operator"
     __desc = "Creates Dataset objects of the specified dataset (sub) type."
 
-    __datasets = {"movielens": MovieLens}
+    # Dataset subclasses by lower case type name, populated by the register decorator.
+    __datasets = {}
 
     def __init__(self, name: str, desc: str, dataset_type: str) -> None:
         self._name = name
         self._desc = desc
         self._dataset_type = dataset_type
-        self._logger = logging.getLogger(
-            f"{self.__module__}.{self.__class__.__name__}",
-        )
 
     def __call__(self, data: pd.DataFrame) -> Dataset:
         """Creates a Dataset object of the appropriate subclass."""
-        try:
-            dataset = DatasetFactoryOperator.__datasets[self._dataset_type.lower()]
-            return dataset(name=self._name, desc=self._desc, data=data)
-        except KeyError:
+        dataset = DatasetFactoryOperator.__datasets.get(self._dataset_type.lower())
+        if dataset is None:
             msg = f"{self._dataset_type} is not a valid Dataset type."
             self._logger.error(msg)
             raise TypeError(msg)
+        return dataset(name=self._name, desc=self._desc, data=data)
+
+    @classmethod
+    def register(cls, dataset_type: str) -> Callable:
+        """Class decorator that registers a Dataset subclass with the factory.
+
+        Args:
+            dataset_type (str): The case insensitive name by which the subclass is created.
+        """
+
+        def decorator(dataset: type[Dataset]) -> type[Dataset]:
+            cls.__datasets[dataset_type.lower()] = dataset
+            return dataset
+
+        return decorator
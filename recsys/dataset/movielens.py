@@ -18,19 +18,52 @@
 # ================================================================================================ #
 from __future__ import annotations
 import warnings
-from copy import deepcopy
-import logging
+from dataclasses import dataclass
+from typing import Union
 
 from scipy.sparse import csr_matrix, csc_matrix, coo_matrix
 import numpy as np
 import pandas as pd
 
 from recsys.dataset.base import Dataset
+from recsys.dataset.factory import DatasetFactoryOperator
+from recsys.services.kernels import group_center, intersect, intersect_counts
 
 warnings.filterwarnings("ignore")
 
+# ------------------------------------------------------------------------------------------------ #
+MB = 1 << 20
+
+
+# ------------------------------------------------------------------------------------------------ #
+@dataclass(slots=True)
+class SortedIndex:
+    """Ratings sorted by a key column, with the location of each key's run of ratings.
+
+    Args:
+        keys (np.ndarray): Sorted unique values of the key column
+        starts (np.ndarray): Offset of the first rating for each key
+        counts (np.ndarray): Number of ratings for each key
+        rows (np.ndarray): Row positions of the ratings in key order
+        values (np.ndarray): The indexed values column in key order, sorted within each key
+    """
+
+    keys: np.ndarray
+    starts: np.ndarray
+    counts: np.ndarray
+    rows: np.ndarray
+    values: np.ndarray
+
+    def locate(self, key: int) -> slice:
+        """Returns the slice of rows and values for the key. The slice is empty if not found."""
+        i = np.searchsorted(self.keys, key)
+        if i == self.keys.size or self.keys[i] != key:
+            return slice(0, 0)
+        return slice(self.starts[i], self.starts[i] + self.counts[i])
+
 
 # ------------------------------------------------------------------------------------------------ #
+@DatasetFactoryOperator.register("movielens")
 class MovieLens(Dataset):
     """Object containing interaction data.
 
@@ -46,6 +79,53 @@ class MovieLens(Dataset):
     __RATING_USER_CENTERED = "rating_cu"
     __RATING_ITEM_CENTERED = "rating_ci"
     __TIMESTAMP = "timestamp"
+    __DTYPES = {
+        __USERID: np.int32,
+        __ITEMID: np.int32,
+        __RATING: np.float32,
+        __RATING_USER_CENTERED: np.float32,
+        __RATING_ITEM_CENTERED: np.float32,
+        __TIMESTAMP: np.int32,
+    }
+
+    # Slots avoid a per-instance __dict__ for the many small datasets created by splits.
+    __slots__ = (
+        "_name",
+        "_desc",
+        "_data",
+        "_columns",
+        "_user_index",
+        "_item_index",
+        "_codes",
+        "_coo",
+        "_csr",
+        "_csc",
+        "_user_ratings",
+        "_item_ratings",
+        "_profiled",
+        "_summary",
+        "_nrows",
+        "_ncols",
+        "_size",
+        "_n_users",
+        "_n_items",
+        "_interaction_matrix_size",
+        "_sparsity",
+        "_density",
+        "_memory_bytes",
+        "_user_item_ratio",
+        "_item_user_ratio",
+        "_mean_ratings_per_user",
+        "_mean_ratings_per_item",
+        "_max_ratings_per_user",
+        "_max_ratings_per_item",
+        "_min_ratings_per_user",
+        "_min_ratings_per_item",
+        "_user_rating_frequency",
+        "_item_rating_frequency",
+        "_user_rating_frequency_distribution",
+        "_item_rating_frequency_distribution",
+    )
 
     def __init__(
         self,
@@ -56,7 +136,9 @@ class MovieLens(Dataset):
         super().__init__()
         self._name = name
         self._desc = desc
-        self._data = data
+        # Narrow dtypes halve the memory traffic of every downstream scan.
+        dtypes = {col: dtype for col, dtype in MovieLens.__DTYPES.items() if col in data.columns}
+        self._data = data.astype(dtypes, copy=False)
 
         self._profiled = False
         self._summary = None
@@ -68,10 +150,39 @@ class MovieLens(Dataset):
         self._interaction_matrix_size = None
         self._sparsity = None
         self._density = None
-        self._memory = None
-        self._logger = logging.getLogger(
-            f"{self.__module__}.{self.__class__.__name__}",
-        )
+        self._memory_bytes = None
+        self._user_rating_frequency = None
+        self._item_rating_frequency = None
+        self._user_rating_frequency_distribution = None
+        self._item_rating_frequency_distribution = None
+
+        # Column arrays give hot loops direct access without constructing Series objects.
+        self._columns = {col: self._data[col].to_numpy() for col in self._data.columns}
+
+        # Maps each user to the items rated, and each item to its raters.
+        self._user_index = self._index(by=MovieLens.__USERID, values=MovieLens.__ITEMID)
+        self._item_index = self._index(by=MovieLens.__ITEMID, values=MovieLens.__USERID)
+        # Contiguous user / item codes by id column, and sparse matrices by rating column,
+        # built on first request.
+        self._codes = {}
+        self._coo = {}
+        self._csr = {}
+        self._csc = {}
+        # Ratings in user and item index order, built on first request.
+        self._user_ratings = {}
+        self._item_ratings = {}
+
+    def __setstate__(self, state: dict | tuple) -> None:
+        """Restores pickled state.
+
+        Pickles written before slots carry only the name, description, data, and profile, so
+        the indexes are rebuilt from the data.
+        """
+        if isinstance(state, dict):
+            self.__init__(name=state["_name"], desc=state["_desc"], data=state["_data"])
+            self._filepath = state.get("_filepath")
+        else:
+            super().__setstate__(state)
 
     @property
     def name(self) -> str:
@@ -88,21 +199,37 @@ class MovieLens(Dataset):
     @property
     def sparsity(self) -> float:
         """Returns measure of sparsity of the data in percent"""
+        self._summarize()
         return self._sparsity
 
     @property
     def density(self) -> float:
         """Returns measure of density of the data in percent"""
+        self._summarize()
         return self._density
 
+    @property
+    def memory(self) -> str:
+        """Returns the memory consumed by the data, formatted in megabytes"""
+        return f"{self.memory_bytes / MB:.3f} Mb"
+
+    @property
+    def memory_bytes(self) -> int:
+        """Returns the memory consumed by the data in bytes, measured on first access."""
+        if self._memory_bytes is None:
+            self._memory_bytes = int(self._data.memory_usage(deep=True).sum())
+        return self._memory_bytes
+
     @property
     def n_users(self) -> int:
         """Returns number of unique users"""
+        self._summarize()
         return self._n_users
 
     @property
     def n_items(self) -> int:
         """Returns number of unique items."""
+        self._summarize()
         return self._n_items
 
     @property
@@ -113,31 +240,35 @@ class MovieLens(Dataset):
     @property
     def nrows(self) -> int:
         """Returns the number of rows in the Dataset"""
+        self._summarize()
         return self._nrows
 
     @property
     def ncols(self) -> int:
         """Returns the number of columns in the Dataset"""
+        self._summarize()
         return self._ncols
 
     @property
     def size(self) -> int:
         """The number of elements in the Dataset"""
+        self._summarize()
         return self._size
 
     @property
     def interaction_matrix_size(self) -> int:
+        self._summarize()
         return self._interaction_matrix_size
 
     @property
     def users(self) -> np.array:
-        """Returns array of unique users"""
-        return np.sort(self._data[MovieLens.__USERID].unique())
+        """Returns a read-only sorted array of unique users"""
+        return self._user_index.keys
 
     @property
     def items(self) -> np.array:
-        """Returns array of unique items"""
-        return np.sort(self._data[MovieLens.__ITEMID].unique())
+        """Returns a read-only sorted array of unique items"""
+        return self._item_index.keys
 
     @property
     def user_item_ratio(self) -> float:
@@ -152,32 +283,38 @@ class MovieLens(Dataset):
     @property
     def user_rating_frequency(self) -> pd.DataFrame:
         """Returns number of ratings by user."""
-        return (
-            self._data[MovieLens.__USERID]
-            .value_counts()
-            .to_frame(name="n_ratings")
-            .reset_index(names=[MovieLens.__USERID])
-        )
+        if self._user_rating_frequency is None:
+            self._user_rating_frequency = self._frequency(
+                index=self._user_index, name=MovieLens.__USERID
+            )
+        return self._user_rating_frequency
 
     @property
     def user_rating_frequency_distribution(self) -> pd.DataFrame:
         """Distribution of user rating frequency"""
-        return self.user_rating_frequency["n_ratings"].describe().to_frame().T
+        if self._user_rating_frequency_distribution is None:
+            self._user_rating_frequency_distribution = (
+                self.user_rating_frequency["n_ratings"].describe().to_frame().T
+            )
+        return self._user_rating_frequency_distribution
 
     @property
     def item_rating_frequency(self) -> pd.DataFrame:
         """Returns number of ratings by item."""
-        return (
-            self._data[MovieLens.__ITEMID]
-            .value_counts()
-            .to_frame(name="n_ratings")
-            .reset_index(names=[MovieLens.__ITEMID])
-        )
+        if self._item_rating_frequency is None:
+            self._item_rating_frequency = self._frequency(
+                index=self._item_index, name=MovieLens.__ITEMID
+            )
+        return self._item_rating_frequency
 
     @property
     def item_rating_frequency_distribution(self) -> pd.DataFrame:
         """Distribution of item rating frequency"""
-        return self.item_rating_frequency["n_ratings"].describe().to_frame().T
+        if self._item_rating_frequency_distribution is None:
+            self._item_rating_frequency_distribution = (
+                self.item_rating_frequency["n_ratings"].describe().to_frame().T
+            )
+        return self._item_rating_frequency_distribution
 
     def head(self, n: int = 5) -> pd.DataFrame:
         """Prints n rows from the top of the DataFrame"""
@@ -190,7 +327,10 @@ class MovieLens(Dataset):
         Returns: pd.DataFrame
         """
 
-        return self._data[self._data[MovieLens.__USERID] == useridx]
+        index = self._user_index
+        # Index rows are in item order; sorting restores the original row order.
+        rows = np.sort(index.rows[index.locate(useridx)])
+        return self._data.iloc[rows]
 
     def get_item_ratings(self, itemidx: int) -> pd.DataFrame:
         """Returns ratings for the given item
@@ -198,43 +338,109 @@ class MovieLens(Dataset):
             itemidx (int): Index for the item / movie
         Returns: pd.DataFrame
         """
-        return self._data[self._data[MovieLens.__ITEMID] == itemidx]
+        index = self._item_index
+        rows = np.sort(index.rows[index.locate(itemidx)])
+        return self._data.iloc[rows]
+
+    def user_slice(self, useridx: int, column: str = "rating") -> tuple[np.ndarray, np.ndarray]:
+        """Returns the items rated by the user and the ratings, in item order.
+
+        The user index is laid out like the rows of a csr matrix, so both arrays are views
+        of contiguous runs and no rows are scanned or copied. The ratings column is permuted
+        into index order once and cached, so centered ratings are as cheap as raw ones.
+
+        Args:
+            useridx (int): The index for the user
+            column (str): The ratings column, i.e. rating, rating_cu or rating_ci
+        """
+        if column not in self._user_ratings:
+            self._user_ratings[column] = self.column(column)[self._user_index.rows]
+        index = self._user_index
+        run = index.locate(useridx)
+        return index.values[run], self._user_ratings[column][run]
+
+    def item_slice(self, itemidx: int, column: str = "rating") -> tuple[np.ndarray, np.ndarray]:
+        """Returns the users who rated the item and the ratings, in user order.
 
-    def get_users_rated_item(self, itemidx: int) -> list:
-        """Returns a list of users who have rated itemidx
+        Args:
+            itemidx (int): The index for the item
+            column (str): The ratings column, i.e. rating, rating_cu or rating_ci
+        """
+        if column not in self._item_ratings:
+            self._item_ratings[column] = self.column(column)[self._item_index.rows]
+        index = self._item_index
+        run = index.locate(itemidx)
+        return index.values[run], self._item_ratings[column][run]
+
+    def get_users_rated_item(self, itemidx: int) -> np.ndarray:
+        """Returns a sorted array of users who have rated itemidx
         Args:
             itemidx (int): The index for the item
         """
-        return self._data[self._data[MovieLens.__ITEMID] == itemidx][MovieLens.__USERID].tolist()
+        index = self._item_index
+        return index.values[index.locate(itemidx)]
 
-    def get_items_rated_user(self, useridx: int) -> list:
-        """Returns a list of items rated by useridx.
+    def get_items_rated_user(self, useridx: int) -> np.ndarray:
+        """Returns a sorted array of items rated by useridx.
         Args:
             useridx (int): The index for the user
         """
-        return self._data[self._data[MovieLens.__USERID] == useridx][MovieLens.__ITEMID].tolist()
+        index = self._user_index
+        return index.values[index.locate(useridx)]
 
-    def get_items_rated_users(self, u: int, v: int) -> set:
-        """Returns a list of items rated by both u and v.
+    def get_items_rated_users(self, u: int, v: int) -> np.ndarray:
+        """Returns a sorted array of items rated by both u and v.
 
         Args:
             u (int): A user index
             v (int): A user index
         """
-        Iu = self.get_items_rated_user(useridx=u)
-        Iv = self.get_items_rated_user(useridx=v)
-        return set(Iu).intersection(Iv)
+        index = self._user_index
+        Iu = index.values[index.locate(u)]
+        Iv = index.values[index.locate(v)]
+        return intersect(Iu, Iv)
 
-    def get_users_rated_items(self, i: int, j: int) -> set:
-        """Returns a list of users who have rated both items i and j.
+    def get_users_rated_items(self, i: int, j: int) -> np.ndarray:
+        """Returns a sorted array of users who have rated both items i and j.
 
         Args:
             i (int): An item index
             j (int): An item index
         """
-        Ui = self.get_users_rated_item(itemidx=i)
-        Uj = self.get_users_rated_item(itemidx=j)
-        return set(Ui).intersection(Uj)
+        index = self._item_index
+        Ui = index.values[index.locate(i)]
+        Uj = index.values[index.locate(j)]
+        return intersect(Ui, Uj)
+
+    def corating_counts(self, pairs: np.ndarray, by: str = "user") -> np.ndarray:
+        """Returns the number of co-ratings for each pair of users or items.
+
+        For user pairs, this is the number of items rated by both users. For item pairs,
+        it is the number of users who rated both items.
+
+        Args:
+            pairs (np.ndarray): Array of shape (n, 2) containing pairs of user or item ids.
+            by (str): Valid values in ['user', 'item']. Default is 'user'
+        Raises: ValueError if by is not a valid value.
+        """
+        if isinstance(by, str) and "user" in by:
+            index = self._user_index
+        elif isinstance(by, str) and "item" in by:
+            index = self._item_index
+        else:
+            msg = f"Invalid by value {by}. Valid values are ['user', 'item']."
+            self._logger.error(msg)
+            raise ValueError(msg)
+        pairs = np.asarray(pairs)
+        if index.keys.size == 0:
+            return np.zeros(len(pairs), dtype=np.int64)
+        # Positions of each id in the index, or -1 for ids without ratings.
+        positions = np.searchsorted(index.keys, pairs)
+        found = index.keys[np.minimum(positions, index.keys.size - 1)] == pairs
+        positions = np.where(found, positions, -1)
+        return intersect_counts(
+            index.starts, index.counts, index.values, positions[:, 0], positions[:, 1]
+        )
 
     def compare(self, other: MovieLens) -> pd.DataFrame:
         """Compare this and another MovieLens returning descriptive statistics.
@@ -242,40 +448,65 @@ class MovieLens(Dataset):
         Args:
             other (MovieLens): The other interaction matrix which to compare.
         """
-        df1 = self._summary
+        df1 = self.summary()
         df2 = other.summary()
+        # Both summaries share the same statistics in the same order, so the change is
+        # computed on the underlying arrays.
+        a = df1.iloc[:, 0].to_numpy()
+        b = df2.iloc[:, 0].to_numpy()
         both = pd.concat([df1, df2], axis=1)
-        both["% change"] = (df1[self._name] - df2[other.name]) / df1[self._name] * 100
+        both["% change"] = (a - b) / a * 100
         return both
 
+    def column(self, name: str) -> np.ndarray:
+        """Returns the designated column as a numpy array.
+
+        The user and item centered ratings, 'rating_cu' and 'rating_ci', are computed on
+        first request if the data doesn't supply them.
+
+        Args:
+            name (str): The name of the column.
+        """
+        if name not in self._columns:
+            if name == MovieLens.__RATING_USER_CENTERED:
+                self._columns[name] = self._center(by=MovieLens.__USERID)
+            elif name == MovieLens.__RATING_ITEM_CENTERED:
+                self._columns[name] = self._center(by=MovieLens.__ITEMID)
+        return self._columns[name]
+
     def to_df(self) -> pd.DataFrame:
-        """Returns the nonzero values in dataframe format"""
-        return deepcopy(self._data)
+        """Returns the nonzero values in dataframe format.
+
+        The frame is a shallow copy sharing the underlying arrays, so it must be treated as
+        read-only. Use .copy() on the result before modifying it.
+        """
+        return self._data.copy(deep=False)
 
     def to_csr(self, centered_by: str = None) -> csr_matrix:
         """Produces a csr matrix
 
+        The user index is already laid out as csr rows with sorted columns, so the matrix
+        is assembled from it directly, without a coo conversion, and cached per rating
+        column. Callers must not modify it in place.
+
         Args:
             centered_by (str): Valid values in [None, 'user', 'item']. Default is None
 
         Returns: scipy.sparse.csr_matrix
 
         """
-
-        if centered_by is None:
-            col = MovieLens.__RATING
-        elif "u" in centered_by.lower():
-            col = MovieLens.__RATING_USER_CENTERED
-        else:
-            col = MovieLens.__RATING_ITEM_CENTERED
-
-        rows = self._data[MovieLens.__USERID]
-        cols = self._data[MovieLens.__ITEMID]
-        data = self._data[col]
-        return csr_matrix((data, (rows, cols)), shape=(self.n_users, self.n_items))
+        col = self._rating_column(centered_by=centered_by)
+        if col not in self._csr:
+            self._csr[col] = self._compress(
+                index=self._user_index, by=MovieLens.__ITEMID, col=col, fmt=csr_matrix
+            )
+        return self._csr[col]
 
     def to_csc(self, centered_by: str = None) -> csc_matrix:
-        """Produces a csr matrix
+        """Produces a csc matrix
+
+        Assembled directly from the item index, which is laid out as csc columns with sorted
+        rows, and cached per rating column. Callers must not modify it in place.
 
         Args:
             centered_by (str): Valid values in [None, 'user', 'item']. Default is None
@@ -283,79 +514,73 @@ class MovieLens(Dataset):
         Returns: scipy.sparse.csc_matrix
 
         """
-
-        if centered_by is None:
-            col = MovieLens.__RATING
-        elif "user" in centered_by:
-            col = MovieLens.__RATING_USER_CENTERED
-        else:
-            col = MovieLens.__RATING_ITEM_CENTERED
-
-        rows = self._data[MovieLens.__USERID]
-        cols = self._data[MovieLens.__ITEMID]
-        data = self._data[col]
-        return csc_matrix((data, (rows, cols)), shape=(self.n_users, self.n_items))
+        col = self._rating_column(centered_by=centered_by)
+        if col not in self._csc:
+            self._csc[col] = self._compress(
+                index=self._item_index, by=MovieLens.__USERID, col=col, fmt=csc_matrix
+            )
+        return self._csc[col]
 
     def to_coo(self, centered_by: str = None) -> coo_matrix:
-        """Produces a csr matrix
+        """Produces a coo matrix
+
+        Rows and columns are the contiguous user and item codes; the users and items
+        properties map them back to ids. The matrix is built once per rating column from the
+        int32 code arrays and cached. Callers must not modify it in place.
 
         Args:
             centered_by (str): Valid values in [None, 'user', 'item']. Default is None
 
-        Returns: scipy.sparse.csc_matrix
+        Returns: scipy.sparse.coo_matrix
 
         """
-        if centered_by is None:
-            col = MovieLens.__RATING
-        elif "user" in centered_by:
-            col = MovieLens.__RATING_USER_CENTERED
-        else:
-            col = MovieLens.__RATING_ITEM_CENTERED
-
-        rows = self._data[MovieLens.__USERID]
-        cols = self._data[MovieLens.__ITEMID]
-        data = self._data[col]
-        return coo_matrix((data, (rows, cols)), shape=(self.n_users, self.n_items))
+        col = self._rating_column(centered_by=centered_by)
+        if col not in self._coo:
+            rows = self._get_codes(by=MovieLens.__USERID)
+            cols = self._get_codes(by=MovieLens.__ITEMID)
+            shape = (self._user_index.keys.size, self._item_index.keys.size)
+            self._coo[col] = coo_matrix((self.column(col), (rows, cols)), shape=shape)
+        return self._coo[col]
 
     def to_binary(self) -> csr_matrix:
-        """Returns a user/item interaction matrix in csr format"""
-        df = self._data[[MovieLens.__USERID, MovieLens.__ITEMID]]
-        df["interaction"] = 1
-        rows = df[MovieLens.__USERID]
-        cols = df[MovieLens.__ITEMID]
-        data = df["interaction"]
-        return csr_matrix((data, (rows, cols)), shape=(self.n_users, self.n_items))
+        """Returns a user/item interaction matrix in csr format
+
+        The matrix shares the index structure of the cached csr matrix, so only the data
+        array of ones is allocated.
+        """
+        ratings = self.to_csr()
+        data = np.ones(ratings.indices.size, dtype=np.uint8)
+        return csr_matrix((data, ratings.indices, ratings.indptr), shape=ratings.shape)
 
     def _summarize(self) -> None:
         """Runs a data profile including basic summary statistics"""
         if not self._profiled:
             self._logger.debug("Computing descriptive statistics....")
-            # Computes basic statistics
-            self._nrows = self._data.shape[0]
-            self._ncols = self._data.shape[1]
+            # Computes basic statistics. User and item counts come from the sorted indexes
+            # built on construction, so no further passes over the id columns are needed.
+            self._nrows, self._ncols = self._data.shape
             self._size = self._nrows * self._ncols
-            self._memory = round(self._data.memory_usage(deep=True).sum() / 1024**2, 3)
-            self._n_users = int(self._data[MovieLens.__USERID].nunique())
-            self._n_items = int(self._data[MovieLens.__ITEMID].nunique())
-            self._user_item_ratio = self.user_item_ratio
-            self._item_user_ratio = self.item_user_ratio
+            self._n_users = int(self._user_index.keys.size)
+            self._n_items = int(self._item_index.keys.size)
+            self._user_item_ratio = self._n_users / self._n_items
+            self._item_user_ratio = self._n_items / self._n_users
             self._mean_ratings_per_user = self._nrows / self._n_users
             self._mean_ratings_per_item = self._nrows / self._n_items
             self._interaction_matrix_size = int(self._n_users * self._n_items)
             self._density = self._nrows / (self._n_users * self._n_items) * 100
             self._sparsity = 100 - self._density
-            self._memory = self._data.memory_usage(deep=True).sum()
-            self._max_ratings_per_user = self.user_rating_frequency["n_ratings"].max()
-            self._max_ratings_per_item = self.item_rating_frequency["n_ratings"].max()
-            self._min_ratings_per_user = self.user_rating_frequency["n_ratings"].min()
-            self._min_ratings_per_item = self.item_rating_frequency["n_ratings"].min()
+            self._memory_bytes = self.memory_bytes
+            self._max_ratings_per_user = self._user_index.counts.max()
+            self._max_ratings_per_item = self._item_index.counts.max()
+            self._min_ratings_per_user = self._user_index.counts.min()
+            self._min_ratings_per_item = self._item_index.counts.min()
 
             d = {}
             # d["name"] = self._name
             # d["type"] = self.__class__.__name__
             # d["desc"] = self._desc
-            d["nrows"] = self._data.shape[0]
-            d["ncols"] = self._data.shape[1]
+            d["nrows"] = self._nrows
+            d["ncols"] = self._ncols
             d["n_users"] = self._n_users
             d["n_items"] = self._n_items
             d["max_ratings_per_user"] = self._max_ratings_per_user
@@ -368,10 +593,121 @@ class MovieLens(Dataset):
             d["item_user_ratio"] = self._item_user_ratio
             d["size"] = self._size
             d["interaction_matrix_size"] = self._interaction_matrix_size
-            d["memory"] = self._memory
+            d["memory"] = self._memory_bytes
             d["sparsity"] = self._sparsity
             d["density"] = self._density
 
-            self._summary = pd.DataFrame.from_dict(data=d, orient="index", columns=[self._name])
+            self._summary = pd.Series(d, name=self._name).to_frame()
 
         self._profiled = True
+
+    def _frequency(self, index: SortedIndex, name: str) -> pd.DataFrame:
+        """Returns the number of ratings per key, most frequent first.
+
+        The run lengths of the sorted index are the rating counts, so no hashing pass over
+        the data is needed.
+
+        Args:
+            index (SortedIndex): The user or item index.
+            name (str): Name of the key column.
+        """
+        order = np.argsort(-index.counts, kind="stable")
+        return pd.DataFrame({name: index.keys[order], "n_ratings": index.counts[order]})
+
+    def _center(self, by: str) -> np.ndarray:
+        """Returns the ratings centered on the mean rating of each user or item.
+
+        The means and centered ratings are computed by a compiled kernel in two passes over
+        contiguous codes, rather than a groupby and merge.
+
+        Args:
+            by (str): The id column, i.e. userId or movieId
+        """
+        index = self._user_index if by == MovieLens.__USERID else self._item_index
+        codes = self._get_codes(by=by)
+        ratings = self.column(MovieLens.__RATING)
+        return group_center(codes, ratings, index.keys.size).astype(np.float32, copy=False)
+
+    def _rating_column(self, centered_by: str = None) -> str:
+        """Returns the name of the raw or centered rating column.
+
+        Args:
+            centered_by (str): Valid values in [None, 'user', 'item']. Default is None
+        Raises: ValueError if centered_by is not a valid value.
+        """
+        if centered_by is None:
+            return MovieLens.__RATING
+        elif "user" in centered_by:
+            return MovieLens.__RATING_USER_CENTERED
+        elif "item" in centered_by:
+            return MovieLens.__RATING_ITEM_CENTERED
+        msg = f"Invalid centered_by value {centered_by}. Valid values are [None, 'user', 'item']."
+        self._logger.error(msg)
+        raise ValueError(msg)
+
+    def _compress(
+        self, index: SortedIndex, by: str, col: str, fmt: type
+    ) -> Union[csr_matrix, csc_matrix]:
+        """Assembles a compressed sparse matrix from a sorted index.
+
+        Each run of the index is a compressed row (csr) or column (csc), and the other
+        axis's codes within each run are sorted, so no sort or duplicate pass is needed.
+
+        Args:
+            index (SortedIndex): The user index for csr, or the item index for csc.
+            by (str): The id column of the other axis, i.e. movieId for csr.
+            col (str): The rating column.
+            fmt (type): Either csr_matrix or csc_matrix.
+        """
+        # The row permutation is int32, so the number of ratings fits int32 offsets.
+        indptr = np.zeros(index.keys.size + 1, dtype=np.int32)
+        np.cumsum(index.counts, out=indptr[1:])
+        indices = self._get_codes(by=by)[index.rows]
+        data = self.column(col)[index.rows]
+        shape = (self._user_index.keys.size, self._item_index.keys.size)
+        return fmt((data, indices, indptr), shape=shape)
+
+    def _get_codes(self, by: str) -> np.ndarray:
+        """Returns the position of each row's id in the sorted unique ids, i.e. codes in 0..n-1.
+
+        The codes are read off the sorted index rather than hashed with pd.factorize, and
+        cached. The users and items properties map codes back to ids.
+
+        Args:
+            by (str): The id column, i.e. userId or movieId
+        """
+        if by not in self._codes:
+            index = self._user_index if by == MovieLens.__USERID else self._item_index
+            codes = np.empty(index.rows.size, dtype=np.int32)
+            codes[index.rows] = np.repeat(np.arange(index.keys.size, dtype=np.int32), index.counts)
+            self._codes[by] = codes
+        return self._codes[by]
+
+    def _index(self, by: str, values: str) -> SortedIndex:
+        """Indexes the 'values' column by the 'by' column.
+
+        A lexsort groups each key's ratings contiguously with values sorted within each
+        run, and the run boundaries give the offset and length of each. Lookups are then a
+        binary search and a slice rather than boolean scans over the full DataFrame, and
+        runs can be intersected with a linear merge.
+
+        Args:
+            by (str): The column containing the keys, i.e. userId or movieId
+            values (str): The column containing the values returned for each key.
+        """
+        # Row positions fit in int32, halving the size of the permutation held per index.
+        rows = np.lexsort((self.column(values), self.column(by))).astype(np.int32)
+        # The keys are already sorted, so the runs are found by comparing neighbours rather
+        # than by np.unique, which would sort them a second time.
+        ids = self.column(by)[rows]
+        bounds = np.empty(ids.size, dtype=bool)
+        bounds[:1] = True
+        np.not_equal(ids[1:], ids[:-1], out=bounds[1:])
+        starts = np.flatnonzero(bounds)
+        keys = ids[starts]
+        counts = np.diff(starts, append=ids.size)
+        values = self.column(values)[rows]
+        # Keys and values are handed out as views, so guard them against mutation.
+        keys.flags.writeable = False
+        values.flags.writeable = False
+        return SortedIndex(keys=keys, starts=starts, counts=counts, rows=rows, values=values)
@@ -17,13 +17,30 @@
 # Copyright  : (c) 2023 John James                                                                 #
 # ================================================================================================ #
 import os
+from contextlib import contextmanager
 from dataclasses import dataclass
+from typing import BinaryIO, Iterator
+from zipfile import ZipFile
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.csv as pcsv
+import pyarrow.parquet as pq
 
 from recsys.datasource.base import DataSource
 from recsys.dataprep.download import DownloadOperator
-from recsys.dataprep.extract import ZipExtractOperator
 from recsys.services.io import IOService
 
+# ------------------------------------------------------------------------------------------------ #
+RATINGS_SCHEMA = {
+    "userId": pa.int32(),
+    "movieId": pa.int32(),
+    "rating": pa.float32(),
+    "timestamp": pa.int32(),
+}
+# Each csv block becomes a parquet row group of roughly two million ratings.
+BLOCK_SIZE = 1 << 26
+
 
 # ------------------------------------------------------------------------------------------------ #
 @dataclass
@@ -37,15 +54,51 @@ class MovieLens(DataSource):
     def __post_init__(self) -> None:
         super().__init__()
 
+    @property
+    def ratings_filepath(self) -> str:
+        """Returns the path to the ratings persisted by a prior fetch."""
+        return os.path.join(self.directory, "ratings.parquet")
+
     def fetch_data(self) -> None:
-        """Downloads a data source and extracts the interaction data."""
-        downloader = DownloadOperator(source=self.source, destination=self.destination)
-        downloader.__call__()
+        """Downloads the data source archive.
 
-        extractor = ZipExtractOperator(
-            source=self.destination, destination=self.directory, member=self.filename
+        The download is skipped if the archive already exists, unless force is True. The
+        ratings are parsed straight out of the archive, so nothing is extracted to disk.
+        """
+        downloader = DownloadOperator(
+            source=self.source, destination=self.destination, force=self.force
         )
-        extractor.__call__()
+        downloader.__call__()
+
+    @contextmanager
+    def _open_ratings(self) -> Iterator[BinaryIO]:
+        """Opens the ratings member of the downloaded archive as a decompressing stream."""
+        with ZipFile(self.destination, mode="r") as archive:
+            for info in archive.infolist():
+                if os.path.basename(info.filename) == self.filename:
+                    with archive.open(info) as file:
+                        yield file
+                    return
+        raise FileNotFoundError(f"{self.filename} was not found in {self.destination}.")
+
+    def _read_dat(self) -> pd.DataFrame:
+        """Reads the headerless '::' delimited ratings file.
+
+        Pyarrow parses in parallel but doesn't support multi-character delimiters.
+        Splitting on a single ':' leaves empty fields between the values, which are named
+        and then excluded. The explicit types skip type inference.
+        """
+        names = ["userId", "_", "movieId", "__", "rating", "___", "timestamp"]
+        with self._open_ratings() as file:
+            table = pcsv.read_csv(
+                file,
+                read_options=pcsv.ReadOptions(column_names=names),
+                parse_options=pcsv.ParseOptions(delimiter=":"),
+                convert_options=pcsv.ConvertOptions(
+                    column_types=RATINGS_SCHEMA, include_columns=list(RATINGS_SCHEMA)
+                ),
+            )
+        return table.to_pandas(self_destruct=True)
 
 
 @dataclass
@@ -61,10 +114,12 @@ class MovieLens1M(MovieLens):
     def __post_init__(self) -> None:
         super().__init__()
 
-    def fetch_data(self) -> None:
+    def fetch_data(self) -> pd.DataFrame:
+        if not self.force and os.path.exists(self.ratings_filepath):
+            return IOService.read(self.ratings_filepath)
         super().fetch_data()
-        ratings = IOService.read(os.path.join(self.directory, self.filename), sep="::")
-        IOService.write(filepath=os.path.join(self.directory, "ratings.pkl"), data=ratings)
+        ratings = self._read_dat()
+        IOService.write(filepath=self.ratings_filepath, data=ratings)
         return ratings
 
 
@@ -81,10 +136,12 @@ class MovieLens10M(MovieLens):
     def __post_init__(self) -> None:
         super().__init__()
 
-    def fetch_data(self) -> None:
+    def fetch_data(self) -> pd.DataFrame:
+        if not self.force and os.path.exists(self.ratings_filepath):
+            return IOService.read(self.ratings_filepath)
         super().fetch_data()
-        ratings = IOService.read(os.path.join(self.directory, self.filename), sep="::")
-        IOService.write(filepath=os.path.join(self.directory, "ratings.pkl"), data=ratings)
+        ratings = self._read_dat()
+        IOService.write(filepath=self.ratings_filepath, data=ratings)
         return ratings
 
 
@@ -101,8 +158,28 @@ class MovieLens25M(MovieLens):
     def __post_init__(self) -> None:
         super().__init__()
 
-    def fetch_data(self) -> None:
+    def fetch_data(self) -> pd.DataFrame:
+        if not self.force and os.path.exists(self.ratings_filepath):
+            return IOService.read(self.ratings_filepath)
         super().fetch_data()
-        ratings = IOService.read(os.path.join(self.directory, self.filename))
-        IOService.write(filepath=os.path.join(self.directory, "ratings.pkl"), data=ratings)
-        return ratings
+        # Stream the csv into parquet a block at a time. Explicit types skip type inference.
+        # The parsed batches are kept to build the returned frame, rather than reading the
+        # file just written back from disk. The list is released before conversion, so the
+        # table is the only owner of the buffers and self_destruct can free them as it goes.
+        os.makedirs(self.directory, exist_ok=True)
+        batches = []
+        with self._open_ratings() as file:
+            reader = pcsv.open_csv(
+                file,
+                read_options=pcsv.ReadOptions(block_size=BLOCK_SIZE),
+                convert_options=pcsv.ConvertOptions(column_types=RATINGS_SCHEMA),
+            )
+            with pq.ParquetWriter(
+                self.ratings_filepath, reader.schema, compression="snappy"
+            ) as writer:
+                for batch in reader:
+                    writer.write_batch(batch)
+                    batches.append(batch)
+        table = pa.Table.from_batches(batches, schema=reader.schema)
+        del batches
+        return table.to_pandas(split_blocks=True, self_destruct=True)
@@ -18,19 +18,19 @@
 # ================================================================================================ #
 from __future__ import annotations
 import warnings
-from copy import deepcopy
 
 from scipy.sparse import csr_matrix, csc_matrix, coo_matrix
 import numpy as np
 import pandas as pd
 
-from recsys.matrix.base import Matrix
+from recsys.dataset.base import Dataset
+from recsys.services.kernels import group_center, group_center_pair, intersect
 
 warnings.filterwarnings("ignore")
 
 
 # ------------------------------------------------------------------------------------------------ #
-class InteractionMatrix(Matrix):
+class InteractionMatrix(Dataset):
     """Object containing interaction data.
 
     Args:
@@ -48,6 +48,56 @@ class InteractionMatrix(Matrix):
     __RATING_USER_CENTERED = "rating_cu"
     __RATING_ITEM_CENTERED = "rating_ci"
     __TIMESTAMP = "timestamp"
+    __DTYPES = {
+        __USERIDX: np.int32,
+        __USERID: np.int32,
+        __ITEMIDX: np.int32,
+        __ITEMID: np.int32,
+        __RATING: np.float32,
+        __RATING_USER_CENTERED: np.float32,
+        __RATING_ITEM_CENTERED: np.float32,
+        __TIMESTAMP: np.int32,
+    }
+
+    # The _filepath slot and the class logger are inherited from Asset.
+    __slots__ = (
+        "_name",
+        "_desc",
+        "_data",
+        "_columns",
+        "_user_rows",
+        "_item_rows",
+        "_user_items",
+        "_item_users",
+        "_csr",
+        "_csc",
+        "_coo",
+        "_profiled",
+        "_summary",
+        "_nrows",
+        "_ncols",
+        "_size",
+        "_n_users",
+        "_n_items",
+        "_users",
+        "_items",
+        "_user_item_ratio",
+        "_item_user_ratio",
+        "_mean_ratings_per_user",
+        "_mean_ratings_per_item",
+        "_max_ratings_per_user",
+        "_max_ratings_per_item",
+        "_utility_matrix_size",
+        "_sparsity",
+        "_density",
+        "_memory_bytes",
+        "_user_rating_frequency",
+        "_item_rating_frequency",
+        "_user_rating_frequency_distribution",
+        "_item_rating_frequency_distribution",
+        "_user_average_ratings",
+        "_item_average_ratings",
+    )
 
     def __init__(
         self,
@@ -60,7 +110,12 @@ class InteractionMatrix(Matrix):
         self._name = name
         self._desc = desc
         self._filepath = filepath
-        self._data = data
+        # Narrow dtypes halve the memory traffic of every downstream scan. The derived
+        # columns are added to the new frame, leaving the caller's frame untouched.
+        dtypes = {
+            col: dtype for col, dtype in InteractionMatrix.__DTYPES.items() if col in data.columns
+        }
+        self._data = data.astype(dtypes, copy=False)
 
         self._profiled = False
         self._summary = None
@@ -69,14 +124,36 @@ class InteractionMatrix(Matrix):
         self._size = None
         self._n_users = None
         self._n_items = None
+        self._users = None
+        self._items = None
         self._utility_matrix_size = None
         self._sparsity = None
         self._density = None
-        self._memory = None
+        self._memory_bytes = None
+        self._user_rating_frequency = None
+        self._item_rating_frequency = None
+        self._user_rating_frequency_distribution = None
+        self._item_rating_frequency_distribution = None
+        self._user_average_ratings = None
+        self._item_average_ratings = None
 
         self.reindex()
         self.normalize()
+        # Column arrays give hot loops direct access without constructing Series objects.
+        self._columns = {col: self._data[col].to_numpy() for col in self._data.columns}
+        # Row positions grouped by user and by item, so lookups slice rather than scan.
+        self._user_rows = self._group_rows(by=InteractionMatrix.__USERIDX)
+        self._item_rows = self._group_rows(by=InteractionMatrix.__ITEMIDX)
+        # Sparse matrices by rating column, built on first request.
+        self._csr = {}
+        self._csc = {}
+        self._coo = {}
         self._summarize()
+        # The index structure of the rating csr and csc matrices, built once. Each user's
+        # items and each item's users are then a sorted slice of indices.
+        by_user, by_item = self.to_csr(), self.to_csc()
+        self._user_items = (by_user.indices, by_user.indptr)
+        self._item_users = (by_item.indices, by_item.indptr)
 
     @property
     def name(self) -> str:
@@ -87,8 +164,29 @@ class InteractionMatrix(Matrix):
         return self._desc
 
     @property
-    def filepath(self) -> str:
-        return self._filepath
+    def shape(self) -> tuple:
+        """Returns the shape of the interaction data."""
+        return self._data.shape
+
+    @property
+    def columns(self) -> np.array:
+        """Returns the array of the column names in the Dataset"""
+        return self._data.columns
+
+    @property
+    def nrows(self) -> int:
+        """Returns the number of rows in the Dataset"""
+        return self._nrows
+
+    @property
+    def ncols(self) -> int:
+        """Returns the number of columns in the Dataset"""
+        return self._ncols
+
+    @property
+    def size(self) -> int:
+        """The number of elements in the Dataset"""
+        return self._size
 
     @property
     def sparsity(self) -> float:
@@ -100,6 +198,11 @@ class InteractionMatrix(Matrix):
         """Returns measure of density of the data in percent"""
         return self._density
 
+    @property
+    def memory_bytes(self) -> int:
+        """Returns the memory consumed by the data in bytes"""
+        return self._memory_bytes
+
     @property
     def n_users(self) -> int:
         """Returns number of unique users"""
@@ -116,13 +219,13 @@ class InteractionMatrix(Matrix):
 
     @property
     def users(self) -> np.array:
-        """Returns array of unique users"""
-        return np.sort(self._data[InteractionMatrix.__USERIDX].unique())
+        """Returns a read-only sorted array of unique users"""
+        return self._users
 
     @property
     def items(self) -> np.array:
-        """Returns array of unique items"""
-        return np.sort(self._data[InteractionMatrix.__ITEMIDX].unique())
+        """Returns a read-only sorted array of unique items"""
+        return self._items
 
     @property
     def user_item_ratio(self) -> float:
@@ -137,32 +240,48 @@ class InteractionMatrix(Matrix):
     @property
     def user_rating_frequency(self) -> pd.DataFrame:
         """Returns number of ratings by user."""
-        return (
-            self._data[InteractionMatrix.__USERIDX]
-            .value_counts()
-            .to_frame(name="n_ratings")
-            .reset_index(names=[InteractionMatrix.__USERIDX])
-        )
+        return self._user_rating_frequency
 
     @property
     def user_rating_frequency_distribution(self) -> pd.DataFrame:
         """Distribution of user rating frequency"""
-        return self.user_rating_frequency["n_ratings"].describe().to_frame().T
+        if self._user_rating_frequency_distribution is None:
+            self._user_rating_frequency_distribution = (
+                self.user_rating_frequency["n_ratings"].describe().to_frame().T
+            )
+        return self._user_rating_frequency_distribution
 
     @property
     def item_rating_frequency(self) -> pd.DataFrame:
         """Returns number of ratings by item."""
-        return (
-            self._data[InteractionMatrix.__ITEMIDX]
-            .value_counts()
-            .to_frame(name="n_ratings")
-            .reset_index(names=[InteractionMatrix.__ITEMIDX])
-        )
+        return self._item_rating_frequency
 
     @property
     def item_rating_frequency_distribution(self) -> pd.DataFrame:
         """Distribution of item rating frequency"""
-        return self.item_rating_frequency["n_ratings"].describe().to_frame().T
+        if self._item_rating_frequency_distribution is None:
+            self._item_rating_frequency_distribution = (
+                self.item_rating_frequency["n_ratings"].describe().to_frame().T
+            )
+        return self._item_rating_frequency_distribution
+
+    @property
+    def user_average_ratings(self) -> np.ndarray:
+        """Returns a read-only array of the average rating of each user, indexed by useridx."""
+        if self._user_average_ratings is None:
+            self._user_average_ratings = self._average_ratings(by=InteractionMatrix.__USERIDX)
+        return self._user_average_ratings
+
+    @property
+    def item_average_ratings(self) -> np.ndarray:
+        """Returns a read-only array of the average rating of each item, indexed by itemidx."""
+        if self._item_average_ratings is None:
+            self._item_average_ratings = self._average_ratings(by=InteractionMatrix.__ITEMIDX)
+        return self._item_average_ratings
+
+    def head(self, n: int = 5) -> pd.DataFrame:
+        """Returns n rows from the top of the DataFrame"""
+        return self._data.head(n)
 
     def get_user_ratings(self, useridx: int) -> pd.DataFrame:
         """Returns ratings created by user.
@@ -171,7 +290,8 @@ class InteractionMatrix(Matrix):
         Returns: pd.DataFrame
         """
 
-        return self._data[self._data[InteractionMatrix.__USERIDX] == useridx]
+        rows = self._get_rows(by=InteractionMatrix.__USERIDX, idx=useridx)
+        return self._data.iloc[rows]
 
     def get_item_ratings(self, itemidx: int) -> pd.DataFrame:
         """Returns ratings for the given item
@@ -179,28 +299,33 @@ class InteractionMatrix(Matrix):
             itemidx (int): Index for the item / movie
         Returns: pd.DataFrame
         """
-        return self._data[self._data[InteractionMatrix.__ITEMIDX] == itemidx]
+        rows = self._get_rows(by=InteractionMatrix.__ITEMIDX, idx=itemidx)
+        return self._data.iloc[rows]
 
-    def get_users_rated_item(self, itemidx: int) -> list:
-        """Returns a list of users who have rated itemidx
+    def get_users_rated_item(self, itemidx: int) -> np.ndarray:
+        """Returns a sorted array of users who have rated itemidx
         Args:
             itemidx (int): The index for the item
         """
-        return self._data[self._data[InteractionMatrix.__ITEMIDX] == itemidx][
-            InteractionMatrix.__USERIDX
-        ].tolist()
+        indices, indptr = self._item_users
+        if not 0 <= itemidx < indptr.size - 1:
+            return indices[:0]
+        return indices[indptr[itemidx] : indptr[itemidx + 1]]
 
-    def get_items_rated_user(self, useridx: int) -> list:
-        """Returns a list of items rated by useridx.
+    def get_items_rated_user(self, useridx: int) -> np.ndarray:
+        """Returns a sorted array of items rated by useridx.
         Args:
             useridx (int): The index for the user
         """
-        return self._data[self._data[InteractionMatrix.__USERIDX] == useridx][
-            InteractionMatrix.__ITEMIDX
-        ].tolist()
+        indices, indptr = self._user_items
+        if not 0 <= useridx < indptr.size - 1:
+            return indices[:0]
+        return indices[indptr[useridx] : indptr[useridx + 1]]
+
+    def get_items_rated_users(self, u: int, v: int) -> np.ndarray:
+        """Returns a sorted array of items rated by both u and v.
 
-    def get_items_rated_users(self, u: int, v: int) -> set:
-        """Returns a list of items rated by both u and v.
+        The runs are already sorted, so they are merged in a single pass with no sort.
 
         Args:
             u (int): A user index
@@ -208,10 +333,12 @@ class InteractionMatrix(Matrix):
         """
         Iu = self.get_items_rated_user(useridx=u)
         Iv = self.get_items_rated_user(useridx=v)
-        return set(Iu).intersection(Iv)
+        return intersect(Iu, Iv)
 
-    def get_users_rated_items(self, i: int, j: int) -> set:
-        """Returns a list of users who have rated both items i and j.
+    def get_users_rated_items(self, i: int, j: int) -> np.ndarray:
+        """Returns a sorted array of users who have rated both items i and j.
+
+        The runs are already sorted, so they are merged in a single pass with no sort.
 
         Args:
             i (int): An item index
@@ -219,12 +346,19 @@ class InteractionMatrix(Matrix):
         """
         Ui = self.get_users_rated_item(itemidx=i)
         Uj = self.get_users_rated_item(itemidx=j)
-        return set(Ui).intersection(Uj)
+        return intersect(Ui, Uj)
 
     def normalize(self) -> None:
         """Normalizes ratings by centering on average item and user rating."""
-        self._center(by="user")
-        self._center(by="item")
+        centered = [
+            InteractionMatrix.__RATING_USER_CENTERED,
+            InteractionMatrix.__RATING_ITEM_CENTERED,
+        ]
+        if any(col in self._data.columns for col in centered):
+            self._center(by="user")
+            self._center(by="item")
+        else:
+            self._center_pair()
         self._arrange_cols()
 
     def compare(self, other: InteractionMatrix) -> pd.DataFrame:
@@ -235,38 +369,56 @@ class InteractionMatrix(Matrix):
         """
         df1 = self._summary
         df2 = other.summary()
+        # Both summaries share the same statistics in the same order, so the change is
+        # computed on the underlying arrays.
+        a = df1.iloc[:, 0].to_numpy()
+        b = df2.iloc[:, 0].to_numpy()
         both = pd.concat([df1, df2], axis=1)
-        both["% change"] = (df1[self._name] - df2[other.name]) / df1[self._name] * 100
+        both["% change"] = (a - b) / a * 100
         return both
 
+    def column(self, name: str) -> np.ndarray:
+        """Returns the designated column as a numpy array.
+
+        Args:
+            name (str): The name of the column.
+        """
+        return self._columns[name]
+
     def to_df(self) -> pd.DataFrame:
-        """Returns the nonzero values in dataframe format"""
-        return deepcopy(self._data)
+        """Returns the nonzero values in dataframe format.
+
+        The frame is a shallow copy sharing the underlying arrays, so it must be treated as
+        read-only. Use .copy() on the result before modifying it.
+        """
+        return self._data.copy(deep=False)
 
     def to_csr(self, centered_by: str = None) -> csr_matrix:
         """Produces a csr matrix
 
+        The matrix is built once per rating column, with sorted indices, and cached for
+        the similarity computations. Callers must not modify it in place.
+
         Args:
             centered_by (str): Valid values in [None, 'user', 'item']. Default is None
 
         Returns: scipy.sparse.csr_matrix
 
         """
-
-        if centered_by is None:
-            col = InteractionMatrix.__RATING
-        elif "u" in centered_by.lower():
-            col = InteractionMatrix.__RATING_USER_CENTERED
-        else:
-            col = InteractionMatrix.__RATING_ITEM_CENTERED
-
-        rows = self._data[InteractionMatrix.__USERIDX]
-        cols = self._data[InteractionMatrix.__ITEMIDX]
-        data = self._data[col]
-        return csr_matrix((data, (rows, cols)), shape=(self.n_users, self.n_items))
+        col = self._rating_column(centered_by=centered_by)
+        if col not in self._csr:
+            rows = self.column(InteractionMatrix.__USERIDX)
+            cols = self.column(InteractionMatrix.__ITEMIDX)
+            csr = csr_matrix((self.column(col), (rows, cols)), shape=(self.n_users, self.n_items))
+            csr.sort_indices()
+            self._csr[col] = csr
+        return self._csr[col]
 
     def to_csc(self, centered_by: str = None) -> csc_matrix:
-        """Produces a csr matrix
+        """Produces a csc matrix
+
+        The matrix is converted from the csr matrix once per rating column and cached.
+        Callers must not modify it in place.
 
         Args:
             centered_by (str): Valid values in [None, 'user', 'item']. Default is None
@@ -274,48 +426,37 @@ class InteractionMatrix(Matrix):
         Returns: scipy.sparse.csc_matrix
 
         """
-
-        if centered_by is None:
-            col = InteractionMatrix.__RATING
-        elif "user" in centered_by:
-            col = InteractionMatrix.__RATING_USER_CENTERED
-        else:
-            col = InteractionMatrix.__RATING_ITEM_CENTERED
-
-        rows = self._data[InteractionMatrix.__USERIDX]
-        cols = self._data[InteractionMatrix.__ITEMIDX]
-        data = self._data[col]
-        return csc_matrix((data, (rows, cols)), shape=(self.n_users, self.n_items))
+        col = self._rating_column(centered_by=centered_by)
+        if col not in self._csc:
+            self._csc[col] = self.to_csr(centered_by=centered_by).tocsc()
+        return self._csc[col]
 
     def to_coo(self, centered_by: str = None) -> coo_matrix:
-        """Produces a csr matrix
+        """Produces a coo matrix
+
+        The matrix is expanded from the cached csr matrix once per rating column and cached.
+        Callers must not modify it in place.
 
         Args:
             centered_by (str): Valid values in [None, 'user', 'item']. Default is None
 
-        Returns: scipy.sparse.csc_matrix
+        Returns: scipy.sparse.coo_matrix
 
         """
-        if centered_by is None:
-            col = InteractionMatrix.__RATING
-        elif "user" in centered_by:
-            col = InteractionMatrix.__RATING_USER_CENTERED
-        else:
-            col = InteractionMatrix.__RATING_ITEM_CENTERED
-
-        rows = self._data[InteractionMatrix.__USERIDX]
-        cols = self._data[InteractionMatrix.__ITEMIDX]
-        data = self._data[col]
-        return coo_matrix((data, (rows, cols)), shape=(self.n_users, self.n_items))
+        col = self._rating_column(centered_by=centered_by)
+        if col not in self._coo:
+            self._coo[col] = self.to_csr(centered_by=centered_by).tocoo()
+        return self._coo[col]
 
     def to_binary(self) -> csr_matrix:
-        """Returns a user/item interaction matrix in csr format"""
-        df = self._data[[InteractionMatrix.__USERID, InteractionMatrix.__ITEMID]]
-        df["interaction"] = 1
-        rows = df[InteractionMatrix.__USERIDX]
-        cols = df[InteractionMatrix.__ITEMIDX]
-        data = df["interaction"]
-        return csr_matrix((data, (rows, cols)), shape=(self.n_users, self.n_items))
+        """Returns a user/item interaction matrix in csr format
+
+        The matrix shares the index structure of the cached csr matrix, so only the data
+        array of ones is allocated.
+        """
+        indices, indptr = self._user_items
+        data = np.ones(indices.size, dtype=np.uint8)
+        return csr_matrix((data, indices, indptr), shape=(self.n_users, self.n_items))
 
     def reindex(self) -> None:
         self._logger.debug("Reindexing...")
@@ -355,45 +496,72 @@ class InteractionMatrix(Matrix):
         else:
             self._logger.debug(f"Centering ratings by {by} and storing in {col}.")
 
-            # Obtain average ratings
-            rbar = self._data.groupby(by=by)[InteractionMatrix.__RATING].mean().reset_index()
-            rbar.columns = [by, "rbar"]
+            # The reindexed ids are dense codes, so the average ratings and the centered
+            # ratings are computed in one compiled kernel, with no groupby, merge or
+            # temporary column.
+            codes = self._data[by].to_numpy()
+            ratings = self._data[InteractionMatrix.__RATING].to_numpy()
+            centered = group_center(codes, ratings, int(codes.max()) + 1) + epsilon
+            self._data[col] = centered.astype(np.float32)
+
+    def _center_pair(self, epsilon: float = 1e-9) -> None:
+        """Centers ratings by both the user and item average ratings.
 
-            # Merge with ratings dataset
-            self._data = self._data.merge(rbar, on=by, how="left")
+        Both centerings are fused into one compiled kernel, so the ratings are read once
+        for both sets of averages and both centered columns.
 
-            # Compute centered rating and drop the average rating column
-            self._data[col] = self._data[InteractionMatrix.__RATING] - self._data["rbar"] + epsilon
-            self._data = self._data.drop(columns=["rbar"])
+        Args:
+            epsilon (float): An adjustment to avoid zero mean rating.
+        """
+        self._logger.debug("Centering ratings by user and item.")
+        users = self._data[InteractionMatrix.__USERIDX].to_numpy()
+        items = self._data[InteractionMatrix.__ITEMIDX].to_numpy()
+        ratings = self._data[InteractionMatrix.__RATING].to_numpy()
+        by_user, by_item = group_center_pair(
+            users, items, ratings, int(users.max()) + 1, int(items.max()) + 1
+        )
+        by_user = (by_user + epsilon).astype(np.float32)
+        by_item = (by_item + epsilon).astype(np.float32)
+        self._data[InteractionMatrix.__RATING_USER_CENTERED] = by_user
+        self._data[InteractionMatrix.__RATING_ITEM_CENTERED] = by_item
 
     def _summarize(self) -> None:
         """Runs a data profile including basic summary statistics"""
         if not self._profiled:
             self._logger.debug("Computing descriptive statistics....")
             # Computes basic statistics
-            self._nrows = self._data.shape[0]
-            self._ncols = self._data.shape[1]
+            self._nrows, self._ncols = self._data.shape
             self._size = self._nrows * self._ncols
-            self._memory = round(self._data.memory_usage(deep=True).sum() / 1024**2, 3)
-            self._n_users = int(self._data[InteractionMatrix.__USERIDX].nunique())
-            self._n_items = int(self._data[InteractionMatrix.__ITEMIDX].nunique())
-            self._user_item_ratio = self.user_item_ratio
-            self._item_user_ratio = self.item_user_ratio
+            self._user_rating_frequency = self._frequency(by=InteractionMatrix.__USERIDX)
+            self._item_rating_frequency = self._frequency(by=InteractionMatrix.__ITEMIDX)
+            # The reindexed ids are dense codes, so the counts are the number of row groups.
+            self._n_users = self._user_rows[1].size - 1
+            self._n_items = self._item_rows[1].size - 1
+            # The unique users and items are the codes themselves, built once and guarded
+            # against mutation by callers.
+            self._users = np.arange(self._n_users, dtype=np.int32)
+            self._items = np.arange(self._n_items, dtype=np.int32)
+            self._users.flags.writeable = False
+            self._items.flags.writeable = False
+            self._user_item_ratio = self._n_users / self._n_items
+            self._item_user_ratio = self._n_items / self._n_users
             self._mean_ratings_per_user = self._nrows / self._n_users
             self._mean_ratings_per_item = self._nrows / self._n_items
             self._utility_matrix_size = int(self._n_users * self._n_items)
-            self._sparsity = self._nrows / self._size * 100
-            self._density = 100 - self._sparsity
-            self._memory = self._data.memory_usage(deep=True).sum()
-            self._max_ratings_per_user = self.user_rating_frequency["n_ratings"].max()
-            self._max_ratings_per_item = self.item_rating_frequency["n_ratings"].max()
+            # Density is the share of the utility matrix that has been rated.
+            self._density = self._nrows / self._utility_matrix_size * 100
+            self._sparsity = 100 - self._density
+            self._memory_bytes = int(self._data.memory_usage(deep=True).sum())
+            # The frequencies are sorted in descending order, so the maxima are the first counts.
+            self._max_ratings_per_user = self._user_rating_frequency["n_ratings"].to_numpy()[0]
+            self._max_ratings_per_item = self._item_rating_frequency["n_ratings"].to_numpy()[0]
 
             d = {}
             # d["name"] = self._name
             # d["type"] = self.__class__.__name__
             # d["desc"] = self._desc
-            d["nrows"] = self._data.shape[0]
-            d["ncols"] = self._data.shape[1]
+            d["nrows"] = self._nrows
+            d["ncols"] = self._ncols
             d["n_users"] = self._n_users
             d["n_items"] = self._n_items
             d["max_ratings_per_user"] = self._max_ratings_per_user
@@ -404,22 +572,117 @@ class InteractionMatrix(Matrix):
             d["item_user_ratio"] = self._item_user_ratio
             d["size"] = self._size
             d["utility_matrix_size"] = self._utility_matrix_size
-            d["memory"] = self._memory
+            d["memory"] = self._memory_bytes
             d["sparsity"] = self._sparsity
             d["density"] = self._density
 
-            self._summary = pd.DataFrame.from_dict(data=d, orient="index", columns=[self._name])
+            self._summary = pd.Series(d, name=self._name).to_frame()
 
         self._profiled = True
 
+    def _rating_column(self, centered_by: str = None) -> str:
+        """Returns the name of the raw or centered rating column.
+
+        Args:
+            centered_by (str): Valid values in [None, 'user', 'item']. Default is None
+        Raises: ValueError if centered_by is not a valid value.
+        """
+        if centered_by is None:
+            return InteractionMatrix.__RATING
+        elif "user" in centered_by:
+            return InteractionMatrix.__RATING_USER_CENTERED
+        elif "item" in centered_by:
+            return InteractionMatrix.__RATING_ITEM_CENTERED
+        msg = f"Invalid centered_by value {centered_by}. Valid values are [None, 'user', 'item']."
+        self._logger.error(msg)
+        raise ValueError(msg)
+
+    def _group_rows(self, by: str) -> tuple[np.ndarray, np.ndarray]:
+        """Groups the row positions by the user or item index, in the manner of a csr matrix.
+
+        Returns the row positions ordered by index, and the offsets of each index's run of
+        rows. A stable sort keeps each run in frame order.
+
+        Args:
+            by (str): The useridx or itemidx column.
+        """
+        codes = self.column(by)
+        # Row positions fit in int32, halving the size of the permutation held per group.
+        order = np.argsort(codes, kind="stable").astype(np.int32)
+        indptr = np.zeros(int(codes.max()) + 2, dtype=np.int64)
+        np.cumsum(np.bincount(codes), out=indptr[1:])
+        return order, indptr
+
+    def _locate(self, by: str, idx: int) -> slice:
+        """Returns the slice of the row group for the user or item index, empty if not found.
+
+        Args:
+            by (str): The useridx or itemidx column.
+            idx (int): The user or item index.
+        """
+        _, indptr = self._user_rows if by == InteractionMatrix.__USERIDX else self._item_rows
+        if not 0 <= idx < indptr.size - 1:
+            return slice(0, 0)
+        return slice(indptr[idx], indptr[idx + 1])
+
+    def _get_rows(self, by: str, idx: int) -> np.ndarray:
+        """Returns the positions of the rows for the user or item index, in frame order.
+
+        Args:
+            by (str): The useridx or itemidx column.
+            idx (int): The user or item index.
+        """
+        order, _ = self._user_rows if by == InteractionMatrix.__USERIDX else self._item_rows
+        return order[self._locate(by=by, idx=idx)]
+
+    def _frequency(self, by: str) -> pd.DataFrame:
+        """Returns the number of ratings per user or item, most frequent first.
+
+        The counts are the run lengths of the row groups, so no further pass over the data
+        is needed. The codes are dense, so each position is also the user or item index.
+
+        Args:
+            by (str): The useridx or itemidx column.
+        """
+        _, indptr = self._user_rows if by == InteractionMatrix.__USERIDX else self._item_rows
+        counts = np.diff(indptr)
+        order = np.argsort(-counts, kind="stable")
+        return pd.DataFrame({by: order.astype(np.int32), "n_ratings": counts[order]})
+
+    def _average_ratings(self, by: str) -> np.ndarray:
+        """Returns the average rating of each user or item, indexed by the user or item index.
+
+        The codes are dense, so the sums are a weighted histogram of the codes and the counts
+        are the run lengths of the row groups, with no groupby.
+
+        Args:
+            by (str): The useridx or itemidx column.
+        """
+        _, indptr = self._user_rows if by == InteractionMatrix.__USERIDX else self._item_rows
+        counts = np.diff(indptr)
+        sums = np.bincount(
+            self.column(by), weights=self.column(InteractionMatrix.__RATING), minlength=counts.size
+        )
+        averages = (sums / np.maximum(counts, 1)).astype(np.float32)
+        averages.flags.writeable = False
+        return averages
+
     def _reindex(self, id: str, to: str) -> None:
-        """Creates sequential ids for users and movies."""
-        # Get unique user or movie ids.
-        features = np.sort(self._data[id].unique())
-        features = pd.DataFrame(data=features, columns=[id])
-        features.reset_index(inplace=True)
-        features = features.rename(columns={"index": to})
-        self._data = self._data.merge(features, how="left", on=id)
+        """Creates sequential ids for users and movies.
+
+        If the ids already form a contiguous range, such as the MovieLens user ids, the
+        codes are the ids less the minimum. Otherwise sorted factorization yields the same
+        codes as ranking the sorted unique ids, without merging a lookup table back onto the
+        ratings.
+        """
+        ids = self._data[id].to_numpy()
+        lo, hi = ids.min(), ids.max()
+        # The range is contiguous if every id in it occurs, checked without hashing.
+        if hi - lo < ids.size and np.bincount(ids - lo).all():
+            codes = ids - lo
+        else:
+            codes, _ = pd.factorize(ids, sort=True)
+        self._data[to] = codes.astype(np.int32)
 
     def _arrange_cols(self) -> None:
         cols = [
@@ -432,4 +695,5 @@ class InteractionMatrix(Matrix):
             InteractionMatrix.__RATING_ITEM_CENTERED,
             InteractionMatrix.__TIMESTAMP,
         ]
-        self._data = self._data[cols]
+        # Reindexing the columns reorders them without copying the underlying arrays.
+        self._data = self._data.reindex(columns=cols, copy=False)
@@ -17,6 +17,7 @@
 # Copyright  : (c) 2023 John James                                                                 #
 # ================================================================================================ #
 """Similarity Matrix Module"""
+import numpy as np
 import pandas as pd
 
 from recsys.matrix.base import Matrix
@@ -41,6 +42,8 @@ class SimilarityMatrix(Matrix):
         super().__init__(name=name, desc=desc, data=data)
         self._measure = measure
         self._dimension = dimension
+        # Pairs sorted by (a, b) with their scores, built on first lookup.
+        self._pairs = None
 
     @property
     def measure(self) -> str:
@@ -49,6 +52,9 @@ class SimilarityMatrix(Matrix):
     def get_similarity(self, a: int, b: int) -> float:
         """Returns the similarity measure for a pair of users or items.
 
+        The pairs are sorted once, so each lookup is a binary search rather than a scan of
+        every pair. Returns NaN if the pair has no similarity score.
+
         Args:
             a (int): Either a user or item
             b (int): Either a user or item, matching type of a.
@@ -57,4 +63,28 @@ class SimilarityMatrix(Matrix):
             c = a
             a = b
             b = c
-        return self._dataframe[(self._dataframe["a"] == a) & (self._dataframe["b"] == b)]["score"]
+        if self._pairs is None:
+            self._pairs = self._sort_pairs()
+        keys_a, keys_b, scores = self._pairs
+        lo = np.searchsorted(keys_a, a, side="left")
+        hi = np.searchsorted(keys_a, a, side="right")
+        i = lo + np.searchsorted(keys_b[lo:hi], b)
+        if i < hi and keys_b[i] == b:
+            return float(scores[i])
+        return np.nan
+
+    def _sort_pairs(self) -> tuple:
+        """Returns the a, b and score arrays sorted by a, then b.
+
+        The ids are held as int32 and the scores as float32, halving the memory scanned by
+        each binary search.
+        """
+        keys_a = self._dataframe["a"].to_numpy()
+        keys_b = self._dataframe["b"].to_numpy()
+        order = np.lexsort((keys_b, keys_a))
+        scores = self._dataframe["score"].to_numpy()[order]
+        return (
+            keys_a[order].astype(np.int32),
+            keys_b[order].astype(np.int32),
+            scores.astype(np.float32),
+        )
@@ -31,10 +31,12 @@ class Database:
 
     def __init__(self, filepath: str) -> None:
         self._filepath = filepath
+        self._engine = None
 
     @property
     def engine(self) -> engine:
-        """Returns an SQLAlchemy engine."""
-        os.makedirs(os.path.dirname(self._filepath), exist_ok=True)
-        engine = create_engine(self._filepath)
-        return engine
+        """Returns an SQLAlchemy engine, created on first access and shared thereafter."""
+        if self._engine is None:
+            os.makedirs(os.path.dirname(self._filepath), exist_ok=True)
+            self._engine = create_engine(self._filepath)
+        return self._engine
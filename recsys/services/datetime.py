@@ -30,7 +30,7 @@ HOURS_PER_DAY = 24
 # ------------------------------------------------------------------------------------------------ #
 
 
-@dataclass
+@dataclass(slots=True)
 class Duration:
     """Represents duration, given seconds"""
 
@@ -132,6 +132,7 @@ class CSVIO(IO):  # pragma: no cover
             usecols=usecols,
             low_memory=low_memory,
             encoding=encoding,
+            **kwargs,
         )
 
     @classmethod
@@ -190,7 +191,7 @@ class PickleIO(IO):  # pragma: no cover
         with open(filepath, "rb") as f:
             try:
                 return pickle.load(f)
-            except pickle.PickleError() as e:  # pragma: no cover
+            except pickle.PickleError as e:  # pragma: no cover
                 cls._logger.error(e)
                 raise IOError(e)
             finally:
@@ -202,8 +203,10 @@ class PickleIO(IO):  # pragma: no cover
         # use "ab+"
         with open(filepath, write_mode) as f:
             try:
-                pickle.dump(data, f)
-            except pickle.PickleError() as e:  # pragma: no cover
+                # Pickling straight into the buffered file streams framed chunks, so no full
+                # serialized copy of the asset is allocated per write.
+                pickle.dump(data, f, protocol=pickle.HIGHEST_PROTOCOL)
+            except pickle.PickleError as e:  # pragma: no cover
                 cls._logger.error(e)
                 raise (e)
             finally:
@@ -217,16 +220,28 @@ class PickleIO(IO):  # pragma: no cover
 
 class ParquetIO(IO):  # pragma: no cover
     @classmethod
-    def _read(cls, filepath: str, **kwargs) -> Any:
-        """Read the pyarrow table, then convert to pandas."""
-        table = pa.parquet.read_table(filepath, memory_map=True)
-        return table.to_pandas()
+    def _read(cls, filepath: str, columns: List[str] = None, **kwargs) -> Any:
+        """Read the pyarrow table, then convert to pandas.
+
+        Only the designated columns are read from the file. If None, all columns are read.
+        Each column becomes its own block and the arrow buffers are released as they are
+        converted, so the table and the frame are never both held in full.
+        """
+        table = pq.read_table(filepath, columns=columns, memory_map=True)
+        return table.to_pandas(split_blocks=True, self_destruct=True)
 
     @classmethod
-    def _write(cls, filepath: str, data: pd.DataFrame, **kwargs) -> None:
+    def _write(
+        cls,
+        filepath: str,
+        data: pd.DataFrame,
+        compression: str = "snappy",
+        row_group_size: int = 1_000_000,
+        **kwargs,
+    ) -> None:
         """Converts Pandas DataFrame to a pyarrow table, then persists."""
         table = pa.Table.from_pandas(data)
-        pq.write_table(table, filepath)
+        pq.write_table(table, filepath, compression=compression, row_group_size=row_group_size)
 
 
 # ------------------------------------------------------------------------------------------------ #
@@ -0,0 +1,182 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ================================================================================================ #
+# Project    : Recommender Systems Lab: Towards State-of-the-Art                                   #
+# Version    : 0.1.0                                                                               #
+# Python     : 3.10.8                                                                              #
+# Filename   : /recsys/services/kernels.py                                                         #
+# ------------------------------------------------------------------------------------------------ #
+# Author     : John James                                                                          #
+# Email      : john.james.ai.studio@gmail.com                                                      #
+# URL        : https://github.com/john-james-ai/recsys-lab                                         #
+# ------------------------------------------------------------------------------------------------ #
+# Created    : Tuesday March 21st 2023 09:14:52 am                                                 #
+# Modified   : Tuesday March 21st 2023 09:14:52 am                                                 #
+# ------------------------------------------------------------------------------------------------ #
+# License    : MIT License                                                                         #
+# Copyright  : (c) 2023 John James                                                                 #
+# ================================================================================================ #
+"""Compiled Kernels Module
+
+The kernels are compiled with numba, which environment.yml pins to 0.56.4, a release built
+for the pinned numpy 1.23 and Python 3.10. Numba remains optional: if it isn't installed, the
+kernels fall back to equivalent, slower numpy code, and a message is logged saying so.
+"""
+import logging
+
+import numpy as np
+
+try:
+    from numba import njit, prange
+except ImportError:  # pragma: no cover
+    logging.getLogger(__name__).info("Numba is not installed. Using the numpy kernels.")
+    njit = None
+    prange = range
+
+
+# ------------------------------------------------------------------------------------------------ #
+def _intersect_count(a: np.ndarray, b: np.ndarray) -> int:
+    """Counts the values common to two sorted arrays with a two pointer merge."""
+    i = 0
+    j = 0
+    n = 0
+    while i < a.size and j < b.size:
+        if a[i] < b[j]:
+            i += 1
+        elif a[i] > b[j]:
+            j += 1
+        else:
+            n += 1
+            i += 1
+            j += 1
+    return n
+
+
+def _intersect(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """Returns the values common to two sorted arrays with a two pointer merge."""
+    out = np.empty(min(a.size, b.size), dtype=a.dtype)
+    i = 0
+    j = 0
+    n = 0
+    while i < a.size and j < b.size:
+        if a[i] < b[j]:
+            i += 1
+        elif a[i] > b[j]:
+            j += 1
+        else:
+            out[n] = a[i]
+            n += 1
+            i += 1
+            j += 1
+    return out[:n]
+
+
+def _intersect_counts(
+    starts: np.ndarray, counts: np.ndarray, values: np.ndarray, a: np.ndarray, b: np.ndarray
+) -> np.ndarray:
+    """Counts the values common to each pair of runs (a[k], b[k]) in a sorted index.
+
+    Args:
+        starts (np.ndarray): Offset of each run in values
+        counts (np.ndarray): Length of each run in values
+        values (np.ndarray): Values sorted within each run.
+        a (np.ndarray): Run positions for the first member of each pair. -1 if missing.
+        b (np.ndarray): Run positions for the second member of each pair. -1 if missing.
+    """
+    out = np.zeros(a.size, dtype=np.int64)
+    for k in prange(a.size):
+        if a[k] < 0 or b[k] < 0:
+            continue
+        x = values[starts[a[k]] : starts[a[k]] + counts[a[k]]]
+        y = values[starts[b[k]] : starts[b[k]] + counts[b[k]]]
+        out[k] = intersect_count(x, y)
+    return out
+
+
+def _group_center(codes: np.ndarray, values: np.ndarray, n_groups: int) -> np.ndarray:
+    """Subtracts from each value the mean value of its group.
+
+    The centered values are float64 whatever the input dtype, so integer ratings are not
+    truncated.
+
+    Args:
+        codes (np.ndarray): Group of each value, in 0..n_groups-1
+        values (np.ndarray): The values to center.
+        n_groups (int): The number of groups.
+    """
+    sums = np.zeros(n_groups)
+    counts = np.zeros(n_groups, dtype=np.int64)
+    for i in range(codes.size):
+        sums[codes[i]] += values[i]
+        counts[codes[i]] += 1
+    means = sums / np.maximum(counts, 1)
+    out = np.empty(codes.size, dtype=np.float64)
+    for i in prange(codes.size):
+        out[i] = values[i] - means[codes[i]]
+    return out
+
+
+def _group_center_pair(
+    a: np.ndarray, b: np.ndarray, values: np.ndarray, n_a: int, n_b: int
+) -> tuple:
+    """Centers the values on the group means of two groupings in one pass over the values.
+
+    As with _group_center, the centered values are float64 whatever the input dtype.
+
+    Args:
+        a (np.ndarray): First grouping of the values, in 0..n_a-1
+        b (np.ndarray): Second grouping of the values, in 0..n_b-1
+        values (np.ndarray): The values to center.
+        n_a (int): The number of groups in the first grouping.
+        n_b (int): The number of groups in the second grouping.
+    """
+    sums_a = np.zeros(n_a)
+    sums_b = np.zeros(n_b)
+    counts_a = np.zeros(n_a, dtype=np.int64)
+    counts_b = np.zeros(n_b, dtype=np.int64)
+    for i in range(values.size):
+        sums_a[a[i]] += values[i]
+        sums_b[b[i]] += values[i]
+        counts_a[a[i]] += 1
+        counts_b[b[i]] += 1
+    means_a = sums_a / np.maximum(counts_a, 1)
+    means_b = sums_b / np.maximum(counts_b, 1)
+    out_a = np.empty(values.size, dtype=np.float64)
+    out_b = np.empty(values.size, dtype=np.float64)
+    for i in prange(values.size):
+        out_a[i] = values[i] - means_a[a[i]]
+        out_b[i] = values[i] - means_b[b[i]]
+    return out_a, out_b
+
+
+# ------------------------------------------------------------------------------------------------ #
+if njit is not None:
+    intersect = njit(cache=True)(_intersect)
+    intersect_count = njit(cache=True)(_intersect_count)
+    intersect_counts = njit(cache=True, parallel=True)(_intersect_counts)
+    group_center = njit(cache=True, parallel=True, nogil=True)(_group_center)
+    group_center_pair = njit(cache=True, parallel=True, nogil=True)(_group_center_pair)
+else:  # pragma: no cover
+
+    def intersect(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+        """Returns the values common to two sorted arrays of unique values."""
+        return np.intersect1d(a, b, assume_unique=True)
+
+    def intersect_count(a: np.ndarray, b: np.ndarray) -> int:
+        """Counts the values common to two sorted arrays of unique values."""
+        return np.intersect1d(a, b, assume_unique=True).size
+
+    intersect_counts = _intersect_counts
+
+    def group_center(codes: np.ndarray, values: np.ndarray, n_groups: int) -> np.ndarray:
+        """Subtracts from each value the mean value of its group, returning float64."""
+        means = np.bincount(codes, weights=values, minlength=n_groups) / np.maximum(
+            np.bincount(codes, minlength=n_groups), 1
+        )
+        return values.astype(np.float64) - means[codes]
+
+    def group_center_pair(
+        a: np.ndarray, b: np.ndarray, values: np.ndarray, n_a: int, n_b: int
+    ) -> tuple:
+        """Centers the values on the group means of two groupings."""
+        return group_center(a, values, n_a), group_center(b, values, n_b)
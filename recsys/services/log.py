@@ -45,13 +45,13 @@ def log_end(logger: str, classname: str, timer: Timer):
 
 
 def log(func):
+    # The logger depends only on the decorated function, so it is resolved once at decoration.
+    classname = func.__qualname__
+    logger = logging.getLogger(f"{func.__module__}.{classname}")
+
     @functools.wraps(func)
     def wrapper(self, *args, **kwargs):
 
-        module = func.__module__
-        classname = func.__qualname__
-        logger = logging.getLogger(f"{module}.{classname}")
-
         try:
             timer = Timer()
             timer.start()
@@ -17,7 +17,7 @@
 # Copyright  : (c) 2023 John James                                                                 #
 # ================================================================================================ #
 """Sparse Services Matrix"""
-import pandas as pd
+import numpy as np
 
 # ------------------------------------------------------------------------------------------------ #
 
@@ -29,8 +29,13 @@ def sparse_divide_nonzero(a, b):
 
 
 def get_element(matrix, row, col):
-    rows, cols = matrix.nonzero()
-    d = {"row": rows, "col": cols, "data": matrix.data}
-    df = pd.DataFrame(data=d)
-    element = df[(df["row"] == row) & (df["col"] == col)]["data"].values[0]
-    return element
+    # Only the run of stored elements for the row, or the column of a csc matrix, is searched,
+    # rather than every nonzero. Other formats are converted to csr first.
+    if matrix.format == "csc":
+        major, minor = col, row
+    else:
+        matrix = matrix.tocsr()
+        major, minor = row, col
+    start, end = matrix.indptr[major], matrix.indptr[major + 1]
+    position = np.flatnonzero(matrix.indices[start:end] == minor)[0]
+    return matrix.data[start + position]
@@ -19,10 +19,16 @@
 from abc import ABC, abstractmethod
 from typing import Any, Union
 from datetime import datetime
+import logging
 
 
 # ------------------------------------------------------------------------------------------------ #
 class Event(ABC):  # pragma: no cover
+    def __init_subclass__(cls, **kwargs) -> None:
+        """Creates one logger per class rather than one per instance."""
+        super().__init_subclass__(**kwargs)
+        cls._logger = logging.getLogger(f"{cls.__module__}.{cls.__name__}")
+
     @property
     @abstractmethod
     def name(self) -> str:
@@ -19,7 +19,6 @@
 """Pipeline Module"""
 from abc import abstractmethod
 from datetime import datetime
-import logging
 
 from recsys import Dataset
 from recsys.workflow.task import Task
@@ -48,8 +47,6 @@ class Pipeline(Event):
         self._ended = None
         self._duration = None
 
-        self._logger = logging.getLogger(f"{self.__module__}.{self.__class__.__name__}")
-
     @property
     def name(self) -> str:
         return self._name
@@ -18,7 +18,6 @@
 # ================================================================================================ #
 from typing import Union
 from datetime import datetime
-import logging
 from typing import Union, Any
 
 import mlflow
@@ -69,9 +68,6 @@ class Task(Event):
         self._started = None
         self._ended = None
         self._duration = None
-        self._logger = logging.getLogger(
-            f"{self.__module__}.{self.__class__.__name__}",
-        )
 
     def __call__(self, data: Union[pd.DataFrame, Dataset]) -> Union[None, pd.DataFrame, Dataset]:
         """Runs the task."""
@@ -143,13 +139,4 @@ class Task(Event):
     def _log_output(self) -> None:
         """Logs the artifact in MLFlow."""
         if self._operator.artifact is not None:
-            if self._operator.artifact.isfile:
-                mlflow.log_artifact(
-                    local_path=self._operator.artifact.path,
-                    artifact_path=self._operator.artifact.uripath,
-                )
-            else:
-                mlflow.log_artifacts(
-                    local_dir=self._operator.artifact.path,
-                    artifact_path=self._operator.artifact.uripath,
-                )
+            self._operator.artifact.log()
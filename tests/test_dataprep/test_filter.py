@@ -0,0 +1,261 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ================================================================================================ #
+# Project    : Recommender Systems Lab: Towards State-of-the-Art                                   #
+# Version    : 0.1.0                                                                               #
+# Python     : 3.10.8                                                                              #
+# Filename   : /tests/test_dataprep/test_filter.py                                                 #
+# ------------------------------------------------------------------------------------------------ #
+# Author     : John James                                                                          #
+# Email      : john.james.ai.studio@gmail.com                                                      #
+# URL        : https://github.com/john-james-ai/recsys-lab                                         #
+# ------------------------------------------------------------------------------------------------ #
+# Created    : Saturday March 25th 2023 06:12:40 am                                                #
+# Modified   : Saturday March 25th 2023 06:12:40 am                                                #
+# ------------------------------------------------------------------------------------------------ #
+# License    : MIT License                                                                         #
+# Copyright  : (c) 2023 John James                                                                 #
+# ================================================================================================ #
+import inspect
+from datetime import datetime
+import pytest
+import logging
+
+import numpy as np
+import pandas as pd
+
+from recsys.dataprep.filter import (
+    MaxItemsPerUserFilter,
+    MaxUsersPerItemFilter,
+    MinItemsPerUserFilter,
+    MinUsersPerItemFilter,
+    _cap_interactions,
+    _count_interactions,
+)
+
+
+# ------------------------------------------------------------------------------------------------ #
+logger = logging.getLogger(__name__)
+# ------------------------------------------------------------------------------------------------ #
+double_line = f"\n{100 * '='}"
+single_line = f"\n{100 * '-'}"
+
+CAP = 25
+SEED = 55
+
+
+# ------------------------------------------------------------------------------------------------ #
+@pytest.fixture(scope="module")
+def ratings():
+    """Ratings with non-contiguous ids, and groups both above and below the cap."""
+    rng = np.random.default_rng(0)
+    n = 5000
+    return pd.DataFrame(
+        {
+            "userId": rng.integers(1, 60, n) * 3,
+            "movieId": rng.integers(1, 400, n) * 7,
+            "rating": rng.integers(1, 11, n) / 2,
+            "timestamp": rng.permutation(n) + 10**9,
+        }
+    )
+
+
+@pytest.mark.filter
+class TestCapInteractions:  # pragma: no cover
+    # ============================================================================================ #
+    def test_cap(self, ratings, caplog):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        for by in ("userId", "movieId"):
+            keep, cut = _cap_interactions(
+                data=ratings, by=by, timestamp="timestamp", cap=CAP, random_state=SEED
+            )
+            sizes = ratings.groupby(by).size()
+            retained = ratings[keep].groupby(by).size().reindex(sizes.index, fill_value=0)
+            assert (retained == np.minimum(sizes, CAP)).all()
+            assert cut == (sizes - CAP).clip(lower=0).sum()
+            assert cut == ratings.shape[0] - keep.sum()
+
+            again, _ = _cap_interactions(
+                data=ratings, by=by, timestamp="timestamp", cap=CAP, random_state=SEED
+            )
+            assert (keep == again).all()
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\nCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)
+
+    # ============================================================================================ #
+    def test_filters(self, ratings, caplog):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        user_filter = MaxItemsPerUserFilter(max_items_per_user=CAP, random_state=SEED)
+        data = user_filter(ratings.copy())
+        assert data.groupby("userId").size().max() <= CAP
+        pd.testing.assert_frame_equal(data, user_filter(ratings.copy()))
+        # Capping selects rows, leaving their contents untouched.
+        pd.testing.assert_frame_equal(data, ratings.loc[data.index])
+
+        item_filter = MaxUsersPerItemFilter(max_users_per_item=CAP, random_state=SEED)
+        data = item_filter(ratings.copy())
+        assert data.groupby("movieId").size().max() <= CAP
+        pd.testing.assert_frame_equal(data, item_filter(ratings.copy()))
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\nCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)
+
+    # ============================================================================================ #
+    def test_invalid_cap(self, ratings, caplog):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        for cap in (0, -1):
+            with pytest.raises(ValueError):
+                _cap_interactions(data=ratings, by="userId", timestamp="timestamp", cap=cap)
+            with pytest.raises(ValueError):
+                MaxItemsPerUserFilter(max_items_per_user=cap)
+            with pytest.raises(ValueError):
+                MaxUsersPerItemFilter(max_users_per_item=cap)
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\nCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)
+
+
+@pytest.mark.filter
+class TestCountInteractions:  # pragma: no cover
+    # ============================================================================================ #
+    def test_count(self, ratings, caplog):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        pair = ["userId", "movieId"]
+        assert ratings.duplicated(pair).any()
+        for by in pair:
+            for drop_duplicates in (True, False):
+                codes, counts = _count_interactions(
+                    data=ratings, by=by, pair=pair, drop_duplicates=drop_duplicates
+                )
+                counted = ratings.drop_duplicates(pair) if drop_duplicates else ratings
+                expected = counted.groupby(by).size()
+                # Each row's count, looked up by its code, matches the groupby count of its id.
+                actual = pd.Series(counts[codes], index=ratings.index)
+                assert (actual == ratings[by].map(expected)).all()
+                assert counts.sum() == counted.shape[0]
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\nCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)
+
+    # ============================================================================================ #
+    def test_min_filters(self, ratings, caplog):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        pair = ["userId", "movieId"]
+        for by, operator in (
+            ("userId", MinItemsPerUserFilter(min_items_per_user=85)),
+            ("movieId", MinUsersPerItemFilter(min_users_per_item=13)),
+        ):
+            sizes = ratings.drop_duplicates(pair).groupby(by).size()
+            threshold = 85 if by == "userId" else 13
+            expected = ratings[ratings[by].isin(sizes.index[sizes >= threshold])]
+            assert 0 < expected.shape[0] < ratings.shape[0]
+            pd.testing.assert_frame_equal(operator(ratings), expected)
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\nCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)
@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ================================================================================================ #
+# Project    : Recommender Systems Lab: Towards State-of-the-Art                                   #
+# Version    : 0.1.0                                                                               #
+# Python     : 3.10.8                                                                              #
+# Filename   : /tests/test_dataprep/test_normalize.py                                              #
+# ------------------------------------------------------------------------------------------------ #
+# Author     : John James                                                                          #
+# Email      : john.james.ai.studio@gmail.com                                                      #
+# URL        : https://github.com/john-james-ai/recsys-lab                                         #
+# ------------------------------------------------------------------------------------------------ #
+# Created    : Saturday March 25th 2023 08:02:17 am                                                #
+# Modified   : Saturday March 25th 2023 08:02:17 am                                                #
+# ------------------------------------------------------------------------------------------------ #
+# License    : MIT License                                                                         #
+# Copyright  : (c) 2023 John James                                                                 #
+# ================================================================================================ #
+import inspect
+from datetime import datetime
+import pytest
+import logging
+
+import numpy as np
+import pandas as pd
+
+from recsys.dataprep.normalize import NormalizeOperator
+
+
+# ------------------------------------------------------------------------------------------------ #
+logger = logging.getLogger(__name__)
+# ------------------------------------------------------------------------------------------------ #
+double_line = f"\n{100 * '='}"
+single_line = f"\n{100 * '-'}"
+
+
+@pytest.mark.normalize
+class TestNormalize:  # pragma: no cover
+    # ============================================================================================ #
+    def test_integer_ratings(self, caplog):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        # Whole star ratings, as in MovieLens 1M, with non-contiguous user ids.
+        rng = np.random.default_rng(0)
+        n = 2000
+        data = pd.DataFrame(
+            {
+                "userId": rng.integers(1, 50, n) * 3,
+                "movieId": rng.integers(1, 300, n) * 7,
+                "rating": rng.integers(1, 6, n),
+            }
+        )
+        for by in ("userId", "movieId"):
+            centered = NormalizeOperator(by=by, epsilon=0.0)(data)
+            expected = data["rating"] - data.groupby(by)["rating"].transform("mean")
+            assert centered["rating_centered"].dtype == np.float32
+            assert np.allclose(centered["rating_centered"], expected, atol=1e-5)
+            # The input is returned with the centered column added, and left unchanged.
+            pd.testing.assert_frame_equal(centered[data.columns], data)
+            assert "rating_centered" not in data.columns
+
+        with pytest.raises(ValueError, match="genre"):
+            NormalizeOperator(by="genre")(data)
+        with pytest.raises(ValueError, match="stars"):
+            NormalizeOperator(by="userId", rating_col="stars")(data)
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\nCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)
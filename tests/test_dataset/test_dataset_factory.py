@@ -67,3 +67,50 @@ class TestDatasetFactoryOperator:  # pragma: no cover
             )
         )
         logger.info(single_line)
+
+    # ============================================================================================ #
+    def test_register(self, dataframe, monkeypatch, caplog):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        # Registers into a copy of the registry, which monkeypatch restores on teardown.
+        registry = "_DatasetFactoryOperator__datasets"
+        monkeypatch.setattr(
+            DatasetFactoryOperator, registry, dict(getattr(DatasetFactoryOperator, registry))
+        )
+
+        @DatasetFactoryOperator.register("MovieLensSubclass")
+        class MovieLensSubclass(MovieLens):
+            pass
+
+        name = "test_dataset_from_registry"
+        desc = "Test Dataset from a registered Dataset subclass"
+        factory = DatasetFactoryOperator(name=name, desc=desc, dataset_type="movielenssubclass")
+        dataset = factory(data=dataframe)
+        assert isinstance(dataset, MovieLensSubclass)
+
+        factory = DatasetFactoryOperator(name=name, desc=desc, dataset_type="unregistered")
+        with pytest.raises(TypeError):
+            factory(data=dataframe)
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\nCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)
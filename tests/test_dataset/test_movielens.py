@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ================================================================================================ #
+# Project    : Recommender Systems Lab: Towards State-of-the-Art                                   #
+# Version    : 0.1.0                                                                               #
+# Python     : 3.10.8                                                                              #
+# Filename   : /tests/test_dataset/test_movielens.py                                               #
+# ------------------------------------------------------------------------------------------------ #
+# Author     : John James                                                                          #
+# Email      : john.james.ai.studio@gmail.com                                                      #
+# URL        : https://github.com/john-james-ai/recsys-lab                                         #
+# ------------------------------------------------------------------------------------------------ #
+# Created    : Saturday March 25th 2023 07:21:55 am                                                #
+# Modified   : Saturday March 25th 2023 07:21:55 am                                                #
+# ------------------------------------------------------------------------------------------------ #
+# License    : MIT License                                                                         #
+# Copyright  : (c) 2023 John James                                                                 #
+# ================================================================================================ #
+import inspect
+import pickle
+from datetime import datetime
+import pytest
+import logging
+
+import numpy as np
+
+from recsys.dataset.movielens import MovieLens
+
+
+# ------------------------------------------------------------------------------------------------ #
+logger = logging.getLogger(__name__)
+# ------------------------------------------------------------------------------------------------ #
+double_line = f"\n{100 * '='}"
+single_line = f"\n{100 * '-'}"
+
+
+# ------------------------------------------------------------------------------------------------ #
+class LegacyMovieLens:
+    """Pickles as a MovieLens carrying the dict state written before the class declared slots."""
+
+    def __init__(self, state: dict) -> None:
+        self._state = state
+
+    def __reduce__(self):
+        return (MovieLens.__new__, (MovieLens,), self._state)
+
+
+@pytest.mark.dataset
+class TestCoratingCounts:  # pragma: no cover
+    # ============================================================================================ #
+    def test_corating_counts(self, dataframe, caplog):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        dataset = MovieLens(name="test_corating_counts", desc="Co-rating counts", data=dataframe)
+        users = dataframe["userId"].unique()[:4]
+        pairs = np.array([[users[0], users[1]], [users[2], users[3]], [users[0], -1]])
+        items = dataframe.groupby("userId")["movieId"].apply(set)
+        expected = [len(items[u] & items[v]) for u, v in pairs[:2]] + [0]
+        assert dataset.corating_counts(pairs, by="user").tolist() == expected
+
+        with pytest.raises(ValueError):
+            dataset.corating_counts(pairs, by="genre")
+        with pytest.raises(ValueError):
+            dataset.corating_counts(pairs, by=None)
+
+        empty = MovieLens(
+            name="test_corating_counts_empty", desc="No ratings", data=dataframe.iloc[:0]
+        )
+        assert empty.corating_counts(pairs, by="item").tolist() == [0, 0, 0]
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\nCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)
+
+
+@pytest.mark.dataset
+class TestPickle:  # pragma: no cover
+    # ============================================================================================ #
+    def test_pickle(self, dataframe, caplog):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        dataset = MovieLens(name="test_pickle", desc="Pickle round trip", data=dataframe)
+        dataset.filepath = "tests/testdata/assets/dataset/MovieLens_test_pickle.pkl"
+        restored = pickle.loads(pickle.dumps(dataset))
+        assert not hasattr(restored, "__dict__")
+        assert (restored.name, restored.desc) == (dataset.name, dataset.desc)
+        assert restored.filepath == dataset.filepath
+        assert restored.to_df().equals(dataset.to_df())
+        assert restored.n_users == dataset.n_users
+
+        # Pickles written before slots hold a plain dict, including the per-instance logger.
+        legacy = {
+            "_name": "test_legacy_pickle",
+            "_desc": "Dict state",
+            "_data": dataframe,
+            "_filepath": "tests/testdata/assets/dataset/MovieLens_test_legacy_pickle.pkl",
+            "_profiled": False,
+            "_summary": None,
+            "_memory": None,
+            "_logger": logging.getLogger("recsys.dataset.movielens.MovieLens"),
+        }
+        restored = pickle.loads(pickle.dumps(LegacyMovieLens(legacy)))
+        assert isinstance(restored, MovieLens)
+        assert (restored.name, restored.desc) == (legacy["_name"], legacy["_desc"])
+        assert restored.filepath == legacy["_filepath"]
+        assert restored.nrows == dataframe.shape[0]
+        assert restored.n_users == dataframe["userId"].nunique()
+        pairs = np.array([dataframe["userId"].unique()[:2]])
+        assert restored.corating_counts(pairs).tolist() == dataset.corating_counts(pairs).tolist()
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\nCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)
@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ================================================================================================ #
+# Project    : Recommender Systems Lab: Towards State-of-the-Art                                   #
+# Version    : 0.1.0                                                                               #
+# Python     : 3.10.8                                                                              #
+# Filename   : /tests/test_feature/test_interaction.py                                             #
+# ------------------------------------------------------------------------------------------------ #
+# Author     : John James                                                                          #
+# Email      : john.james.ai.studio@gmail.com                                                      #
+# URL        : https://github.com/john-james-ai/recsys-lab                                         #
+# ------------------------------------------------------------------------------------------------ #
+# Created    : Saturday March 25th 2023 08:40:12 am                                                #
+# Modified   : Saturday March 25th 2023 08:40:12 am                                                #
+# ------------------------------------------------------------------------------------------------ #
+# License    : MIT License                                                                         #
+# Copyright  : (c) 2023 John James                                                                 #
+# ================================================================================================ #
+import inspect
+import pickle
+from datetime import datetime
+import pytest
+import logging
+
+import numpy as np
+
+from recsys.feature.interaction import InteractionMatrix
+
+
+# ------------------------------------------------------------------------------------------------ #
+logger = logging.getLogger(__name__)
+# ------------------------------------------------------------------------------------------------ #
+double_line = f"\n{100 * '='}"
+single_line = f"\n{100 * '-'}"
+
+FILEPATH = "tests/testdata/assets/matrix/InteractionMatrix_test_interaction.pkl"
+
+
+@pytest.mark.interaction
+class TestInteractionMatrix:  # pragma: no cover
+    # ============================================================================================ #
+    def test_construct(self, dataframe, caplog):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        matrix = InteractionMatrix(
+            name="test_interaction", desc="Interaction matrix", filepath=FILEPATH, data=dataframe
+        )
+        assert not hasattr(matrix, "__dict__")
+        assert matrix.filepath == FILEPATH
+        assert matrix._logger is InteractionMatrix._logger
+        assert matrix.shape == (matrix.nrows, matrix.ncols) == (dataframe.shape[0], 8)
+        assert matrix.size == matrix.nrows * matrix.ncols
+        assert matrix.head(3).shape[0] == 3
+        assert matrix.n_users == dataframe["userId"].nunique()
+        assert matrix.n_items == dataframe["movieId"].nunique()
+
+        df = matrix.to_df()
+        # Centered ratings average to zero for every user and every item.
+        assert np.allclose(df.groupby("useridx")["rating_cu"].mean(), 0, atol=1e-4)
+        assert np.allclose(df.groupby("itemidx")["rating_ci"].mean(), 0, atol=1e-4)
+        assert matrix.to_csr().shape == (matrix.n_users, matrix.n_items)
+
+        restored = pickle.loads(pickle.dumps(matrix))
+        assert restored.filepath == FILEPATH
+        assert restored.to_df().equals(df)
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\nCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)
@@ -420,3 +420,120 @@ class TestCentre:  # pragma: no cover
             )
         )
         logger.info(single_line)
+
+    # ============================================================================================ #
+    def test_add_many(self, datasets, container, caplog):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        centre = container.asset.centre()
+        for dataset in datasets:
+            centre.remove(name=dataset.name, asset_type=dataset.__class__.__name__)
+
+        assets = centre.add_many(datasets)
+        assert len(assets) == len(datasets)
+        for asset in assets:
+            assert os.path.exists(asset.filepath)
+            assert centre.exists(name=asset.name, asset_type=asset.__class__.__name__)
+
+        with pytest.raises(FileExistsError):
+            centre.add_many(datasets)
+
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\n\tCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)
+
+    # ============================================================================================ #
+    def test_get_returns_copy(self, datasets, container, caplog):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        centre = container.asset.centre()
+        name, asset_type = datasets[0].name, datasets[0].__class__.__name__
+        first = centre.get(name=name, asset_type=asset_type)
+        # Each get reads from storage, so mutating one result leaves the next unaffected.
+        first._data["rating"] = 0.0
+        second = centre.get(name=name, asset_type=asset_type)
+        assert second is not first
+        assert (second.to_df()["rating"] != 0.0).all()
+
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\n\tCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)
+
+    # ============================================================================================ #
+    def test_exists_tracks_registry(self, datasets, container, caplog):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        centre = container.asset.centre()
+        dataset = datasets[0]
+        name, asset_type = dataset.name, dataset.__class__.__name__
+        assert centre.exists(name=name, asset_type=asset_type)
+        # Cached registry lookups are dropped when the centre changes the registry.
+        centre.remove(name=name, asset_type=asset_type)
+        assert not centre.exists(name=name, asset_type=asset_type)
+        centre.add(dataset)
+        assert centre.exists(name=name, asset_type=asset_type)
+        assert centre.get(name=name, asset_type=asset_type).name == name
+
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\n\tCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)
@@ -0,0 +1,189 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ================================================================================================ #
+# Project    : Recommender Systems Lab: Towards State-of-the-Art                                   #
+# Version    : 0.1.0                                                                               #
+# Python     : 3.10.8                                                                              #
+# Filename   : /tests/test_services/test_kernels.py                                                #
+# ------------------------------------------------------------------------------------------------ #
+# Author     : John James                                                                          #
+# Email      : john.james.ai.studio@gmail.com                                                      #
+# URL        : https://github.com/john-james-ai/recsys-lab                                         #
+# ------------------------------------------------------------------------------------------------ #
+# Created    : Saturday March 25th 2023 07:03:18 am                                                #
+# Modified   : Saturday March 25th 2023 07:03:18 am                                                #
+# ------------------------------------------------------------------------------------------------ #
+# License    : MIT License                                                                         #
+# Copyright  : (c) 2023 John James                                                                 #
+# ================================================================================================ #
+import sys
+import inspect
+import importlib.util
+from datetime import datetime
+import pytest
+import logging
+
+import numpy as np
+
+
+# ------------------------------------------------------------------------------------------------ #
+logger = logging.getLogger(__name__)
+# ------------------------------------------------------------------------------------------------ #
+double_line = f"\n{100 * '='}"
+single_line = f"\n{100 * '-'}"
+
+
+# ------------------------------------------------------------------------------------------------ #
+@pytest.fixture(scope="module", params=["numba", "numpy"])
+def kernels(request):
+    """Loads the kernels module with numba, and again as a separate copy without it."""
+    if request.param == "numba":
+        pytest.importorskip("numba")
+        from recsys.services import kernels
+
+        return kernels
+    # Blocking the numba import selects the numpy fallback. The copy is loaded under its own
+    # name, so the compiled kernels imported elsewhere are left in place.
+    spec = importlib.util.find_spec("recsys.services.kernels")
+    module = importlib.util.module_from_spec(
+        importlib.util.spec_from_file_location("kernels_fallback", spec.origin)
+    )
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setitem(sys.modules, "numba", None)
+        module.__spec__.loader.exec_module(module)
+    assert module.njit is None
+    return module
+
+
+def sorted_unique(rng: np.random.Generator, high: int) -> np.ndarray:
+    return np.unique(rng.integers(0, high, rng.integers(0, high))).astype(np.int32)
+
+
+@pytest.mark.kernels
+class TestKernels:  # pragma: no cover
+    # ============================================================================================ #
+    def test_intersect(self, kernels, caplog):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        rng = np.random.default_rng(0)
+        empty = np.array([], dtype=np.int32)
+        pairs = [(sorted_unique(rng, 200), sorted_unique(rng, 200)) for _ in range(50)]
+        pairs += [(empty, sorted_unique(rng, 50)), (sorted_unique(rng, 50), empty)]
+        for a, b in pairs:
+            expected = np.intersect1d(a, b, assume_unique=True)
+            assert np.array_equal(kernels.intersect(a, b), expected)
+            assert kernels.intersect_count(a, b) == expected.size
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\nCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)
+
+    # ============================================================================================ #
+    def test_intersect_counts(self, kernels, caplog):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        rng = np.random.default_rng(1)
+        runs = [sorted_unique(rng, 100) for _ in range(30)]
+        counts = np.array([run.size for run in runs])
+        starts = np.concatenate([[0], np.cumsum(counts)[:-1]])
+        values = np.concatenate(runs)
+        a = rng.integers(-1, len(runs), 200)
+        b = rng.integers(-1, len(runs), 200)
+        expected = [
+            0 if i < 0 or j < 0 else np.intersect1d(runs[i], runs[j]).size for i, j in zip(a, b)
+        ]
+        actual = kernels.intersect_counts(starts, counts, values, a, b)
+        assert np.array_equal(actual, expected)
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\nCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)
+
+    # ============================================================================================ #
+    def test_group_center(self, kernels, caplog):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        rng = np.random.default_rng(2)
+        n = 5000
+        # The last group of each grouping has no values, so its mean must not be needed.
+        users = rng.integers(0, 40, n)
+        items = rng.integers(0, 300, n)
+        ratings = (rng.integers(1, 11, n) / 2).astype(np.float32)
+
+        def center(codes: np.ndarray, n_groups: int) -> np.ndarray:
+            sums = np.bincount(codes, weights=ratings, minlength=n_groups)
+            means = sums / np.maximum(np.bincount(codes, minlength=n_groups), 1)
+            return ratings - means[codes]
+
+        by_user = kernels.group_center(users, ratings, 41)
+        assert by_user.dtype == np.float64
+        assert np.allclose(by_user, center(users, 41), atol=1e-5)
+
+        # Integer ratings are centered in floating point rather than truncated.
+        stars = kernels.group_center(np.array([0, 0, 1]), np.array([1, 2, 5]), 2)
+        assert np.array_equal(stars, [-0.5, 0.5, 0.0])
+
+        by_user, by_item = kernels.group_center_pair(users, items, ratings, 41, 301)
+        assert np.allclose(by_user, center(users, 41), atol=1e-5)
+        assert np.allclose(by_item, center(items, 301), atol=1e-5)
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\nCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)